@@ -2,8 +2,6 @@
 import argparse
 
 from src.config import DATA_DIR
-from src.downloader import download_obituaries
-from src.transcriber import transcribe_images
 
 
 def setup_command_line_args():
@@ -25,6 +23,16 @@ def setup_command_line_args():
         nargs="?",
         help="End of range for downloads from (e.g., 1999)",
     )
+    download_parser.add_argument(
+        "--js",
+        action="store_true",
+        help="Run the search in a Playwright browser instead of over plain HTTP",
+    )
+    download_parser.add_argument(
+        "--show-browser",
+        action="store_true",
+        help="Show the Playwright browser window while searching (implies --js)",
+    )
 
     # Transcribe command
     process_parser = subparsers.add_parser(
@@ -46,17 +54,25 @@ def setup_command_line_args():
 
 
 def execute_download(args: argparse.Namespace) -> None:
+    # Imported here so other commands do not pay for the HTTP/browser stack
+    from src.downloader import download_obituaries
 
+    use_browser = args.js or args.show_browser
     if args.yearfrom and args.yearto:  # At least one argument must be provided
-        download_obituaries(args.yearfrom, args.yearto)
+        download_obituaries(args.yearfrom, args.yearto, use_browser, args.show_browser)
     elif args.yearfrom and not args.yearto:
         # If only one argument is provided, set the year_to to the same value
-        download_obituaries(args.yearfrom, args.yearfrom)
+        download_obituaries(
+            args.yearfrom, args.yearfrom, use_browser, args.show_browser
+        )
     else:
         print("Please provide a year to begin downloads from.")
 
 
 def execute_transcription(args: argparse.Namespace) -> None:
+    # Imported here so other commands do not pay for OpenCV and Tesseract
+    from src.transcriber import transcribe_images
+
     if args.directory:
         transcribe_images(args.directory, args.spellcheck)
     else:
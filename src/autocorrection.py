@@ -1,37 +1,30 @@
 from __future__ import annotations
 
-from functools import lru_cache
+from functools import cache
+import os
+from pathlib import Path
+import pickle
+import tempfile
 from threading import Lock
-from typing import Optional, Set
+from typing import Dict, Iterable, Optional, Set, Tuple
 
+import spellchecker
 from spellchecker import SpellChecker
 
 from src.logger import logger
 
 
-class SingletonMeta(type):
+class SpellCheckerSingleton:
     """
-    Thread-safe implementation of Singleton pattern using metaclass.
-    """
-
-    _instances: dict[type, object] = {}
-    _lock: Lock = Lock()
-
-    def __call__(cls, *args: object, **kwargs: object) -> object:
-        with cls._lock:
-            if cls not in cls._instances:  # type:ignore[union-attr]
-                instance = super().__call__(*args, **kwargs)
-                cls._instances[cls] = instance
-        return cls._instances[cls]
+    SpellChecker for the obituary reader project.
 
-
-class SpellCheckerSingleton(metaclass=SingletonMeta):
-    """
-    Thread-safe Singleton SpellChecker for the obituary reader project.
+    Use `get_spell_checker()` to share one instance per process instead of
+    constructing this directly, since loading the dictionary is expensive.
     """
 
     _spell_checker: SpellChecker  # Instance of pyspellchecker.SpellChecker
     _custom_word_file: str = "valid_words.txt"
+    _known_words: frozenset[str] = frozenset()
 
     def __init__(self, custom_word_file: Optional[str] = None):
         """
@@ -43,14 +36,96 @@ class SpellCheckerSingleton(metaclass=SingletonMeta):
         if custom_word_file:
             self._custom_word_file = custom_word_file
 
-        self._spell_checker = SpellChecker()
+        self._spell_checker = self._load_cached() or self._build()
+
+        # Snapshot of the dictionary for O(1) checks of correctly spelled words
+        self._known_words = frozenset(self._spell_checker.word_frequency.dictionary)
+
+    @property
+    def _cache_file(self) -> Path:
+        """Path of the pickled SpellChecker, next to the custom word file."""
+        return Path(self._custom_word_file).resolve().with_suffix(".pkl")
+
+    def _cache_key(self) -> Tuple[str, int, int]:
+        """
+        Identify the inputs a cached SpellChecker was built from.
+
+        Returns:
+            tuple[str, int, int]: The pyspellchecker version and the custom
+            word file's size and modification time in nanoseconds
+
+        Raises:
+            OSError: If the custom word file can't be read
+        """
+        stat = Path(self._custom_word_file).stat()
+        return spellchecker.__version__, stat.st_size, stat.st_mtime_ns
+
+    def _load_cached(self) -> Optional[SpellChecker]:
+        """
+        Load the pickled SpellChecker if it was built from the current inputs.
+
+        Unpickling is several times faster than decompressing the bundled
+        dictionary and re-reading the custom words, and every OCR worker
+        process pays this cost on start. The cache is only used if it was
+        written by the installed pyspellchecker version from a word file of
+        the same size and modification time.
+
+        Returns:
+            SpellChecker | None: The cached SpellChecker, or None if it is
+            missing, stale or unreadable
+        """
+        try:
+            with open(self._cache_file, "rb") as f:
+                cache_key, spell_checker = pickle.load(f)
+            if cache_key != self._cache_key():
+                return None
+        except Exception as e:
+            logger.debug("No usable spell checker cache at %s: %s", self._cache_file, e)
+            return None
+
+        if not isinstance(spell_checker, SpellChecker):
+            return None
+        logger.info(f"Loaded cached spell checker from {self._cache_file}")
+        return spell_checker
+
+    def _build(self) -> SpellChecker:
+        """
+        Build the SpellChecker from the custom word file and cache it on disk.
+
+        Returns:
+            SpellChecker: The new SpellChecker
+        """
+        spell_checker = SpellChecker()
         try:
-            self._spell_checker.word_frequency.load_text_file(self._custom_word_file)
+            # Taken before reading, so an edit made meanwhile invalidates it
+            cache_key = self._cache_key()
+            spell_checker.word_frequency.load_text_file(self._custom_word_file)
             logger.info(f"Loaded custom words from {self._custom_word_file}")
         except Exception as e:
             logger.error(
                 f"Failed to load custom words from {self._custom_word_file}: {e}"
             )
+            return spell_checker
+
+        # Write to a temporary file first, since several worker processes may
+        # build the cache at the same time
+        temp_path: Optional[str] = None
+        try:
+            with tempfile.NamedTemporaryFile(
+                "wb", dir=self._cache_file.parent, delete=False
+            ) as f:
+                temp_path = f.name
+                pickle.dump(
+                    (cache_key, spell_checker),
+                    f,
+                    protocol=pickle.HIGHEST_PROTOCOL,
+                )
+            os.replace(temp_path, self._cache_file)
+        except (OSError, pickle.PicklingError) as e:
+            logger.warning(f"Failed to cache spell checker at {self._cache_file}: {e}")
+            if temp_path:
+                Path(temp_path).unlink(missing_ok=True)
+        return spell_checker
 
     @property
     def spell_checker(self) -> SpellChecker:  # Explicitly specify the return type
@@ -64,6 +139,30 @@ class SpellCheckerSingleton(metaclass=SingletonMeta):
             raise ValueError("SpellChecker is not initialized.")
         return self._spell_checker
 
+    def is_known(self, word: str) -> bool:
+        """
+        Check whether a word is in the dictionary exactly as written.
+
+        Args:
+            word: The word to check
+
+        Returns:
+            bool: True if the word needs no correction
+        """
+        return word in self._known_words
+
+    def unknown(self, words: Iterable[str]) -> set[str]:
+        """
+        Find the words that are not in the dictionary exactly as written.
+
+        Args:
+            words: The words to check
+
+        Returns:
+            set[str]: The words that may need correction
+        """
+        return set(words).difference(self._known_words)
+
     def correction(self, word: str) -> str:
         """
         Get the corrected spelling of a word.
@@ -86,9 +185,51 @@ class SpellCheckerSingleton(metaclass=SingletonMeta):
 # Pre-compile punctuation set for performance
 PUNCT_SET: Set[str] = set('.,:;!?()[]{}""\'')
 
+# The same characters as a string for str.rstrip
+PUNCT_CHARS: str = "".join(sorted(PUNCT_SET))
+
+# Shorter words are left as they are
+MIN_CORRECTION_LENGTH = 3
+
+
+def split_trailing_punctuation(token: str) -> Tuple[str, str]:
+    """
+    Split a whitespace-delimited token into its word and trailing punctuation.
+
+    Args:
+        token: The token to split
+
+    Returns:
+        tuple[str, str]: The word and its trailing punctuation; the word is
+        empty for punctuation-only tokens
+    """
+    # Fast path: most tokens end in a letter
+    if token[-1] not in PUNCT_SET:
+        return token, ""
+    word = token.rstrip(PUNCT_CHARS)
+    return word, token.removeprefix(word)
+
+
+@cache
+def get_spell_checker() -> SpellCheckerSingleton:
+    """
+    Get the shared SpellChecker, creating it on first use.
+
+    Returns:
+        SpellCheckerSingleton: The process-wide SpellChecker instance
+    """
+    return SpellCheckerSingleton()
+
+
+# Upper bound on the number of cached corrections
+CORRECTION_CACHE_SIZE = 100_000
+
+# Cache frequent corrections. Plain dict reads are safe without a lock;
+# the lock only serializes inserts.
+_correction_cache: Dict[str, str] = {}
+_correction_cache_lock: Lock = Lock()
+
 
-# Cache frequent corrections
-@lru_cache(maxsize=10000)
 def cached_correction(word: str) -> str:
     """
     Get the corrected spelling of a word with caching for performance.
@@ -99,47 +240,61 @@ def cached_correction(word: str) -> str:
     Returns:
         str: The corrected word or the original if no correction is found
     """
-    spell_checker = SpellCheckerSingleton()
-    return spell_checker.correction(word)  # type: ignore
+    corrected = _correction_cache.get(word)
+    if corrected is None:
+        corrected = get_spell_checker().correction(word)
+        with _correction_cache_lock:
+            if len(_correction_cache) < CORRECTION_CACHE_SIZE:
+                _correction_cache[word] = corrected
+    return corrected
 
 
-def autocorrect_text(text: str) -> str:
+def is_correctable(word: str) -> bool:
     """
-    Autocorrect misspelled words in a text using pyspellchecker.
+    Check whether a word is worth passing to the spell checker.
+
+    Capitalized words (likely proper nouns), short tokens and tokens with
+    digits or symbols are left as they are.
 
     Args:
-        text: The input text to correct
+        word: The word to check
 
     Returns:
-        str: The corrected text
+        bool: True if the word should be spell checked
     """
-    # Split the text into words
-    words = text.split()
-
-    # Corrected words list
-    corrected_words: list[str] = []
-
-    for word in words:
-        # Preserve punctuation
-        punctuation = ""
-        while word and word[-1] in PUNCT_SET:
-            punctuation = word[-1] + punctuation
-            word = word[:-1]
+    return (
+        len(word) >= MIN_CORRECTION_LENGTH and not word[0].isupper() and word.isalpha()
+    )
 
-        # Skip correction for capitalized words (likely proper nouns)
-        if word and word[0].isupper():
-            corrected_words.append(word + punctuation)
-            continue
 
-        # Skip empty strings
-        if not word:
-            continue
-
-        # Get the corrected word using cached correction
-        corrected = cached_correction(word)
+def autocorrect_text(text: str) -> str:
+    """
+    Autocorrect misspelled words in a text using pyspellchecker.
 
-        # Add back punctuation
-        corrected_words.append(corrected + punctuation)
+    Args:
+        text: The input text to correct
 
-    # Join the corrected words back into a text
-    return " ".join(corrected_words)
+    Returns:
+        str: The corrected text
+    """
+    spell_checker = get_spell_checker()
+
+    # Split the text into words, preserving trailing punctuation, and
+    # skip punctuation-only tokens
+    tokens = [
+        (word, punct)
+        for word, punct in map(split_trailing_punctuation, text.split())
+        if word
+    ]
+
+    # Correctly spelled words (the common case) are filtered out in one set
+    # operation, so only the unknown residue is corrected
+    candidates = {word for word, _ in tokens if is_correctable(word)}
+    corrections = {
+        word: cached_correction(word) for word in spell_checker.unknown(candidates)
+    }
+
+    # Join the corrected words, with their punctuation, back into a text
+    return " ".join(
+        corrections.get(word, word) + punctuation for word, punctuation in tokens
+    )
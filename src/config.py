@@ -5,19 +5,36 @@ from pathlib import Path
 BASE_DIR = Path("obit_transcriber")
 DATA_DIR = Path("obituaries")
 LOG_DIR = Path("logs")
+LOG_MAX_BYTES = 10_000_000  # rotate the log file at this size
+LOG_BACKUP_COUNT = 3  # rotated log files to keep
 
 # OCR Settings
 TESSERACT_CONFIG = r"--oem 3 --psm 1 --dpi 200 -c preserve_interword_spaces=1 -c tessedit_enable_dict_correction=1 -c tessedit_char_whitelist=0123456789abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ.,' '\'\"-"
 
+OCR_WORKERS = None  # worker processes for transcription; None uses the CPU count
+DB_BATCH_SIZE = 50  # records stored per database transaction
+
 # Image preprocessing
 SCALE_FACTOR = 3.0
+USE_CUBIC_UPSCALING = False  # True trades speed for smoother upscaled glyphs
 BILATERAL_FILTER_D = 9
-GAUSSIAN_KERNEL_SIZE = (5, 5)
 BILATERAL_D = 9
 CLAHE_CLIP_LIMIT = 2.0
 CLAHE_TILE_SIZE = (8, 8)
+USE_ADAPTIVE_THRESHOLD = True  # False uses a global Otsu threshold
+ADAPTIVE_THRESHOLD_BLOCK_SIZE = 31  # must be odd
+ADAPTIVE_THRESHOLD_C = 10
 
 # Network settings
+ARCHIVE_URL = "http://obit.glbthistory.org/olo/"
+SEARCH_URL = f"{ARCHIVE_URL}index.jsp"
+BLOCKED_RESOURCE_TYPES = frozenset({"image", "stylesheet", "font", "media"})
 REQUEST_TIMEOUT = 30
-RATE_LIMIT_DELAY = 1  # seconds
+RATE_LIMIT_REQUESTS = 5  # requests per period, across all download threads
+RATE_LIMIT_PERIOD = 1  # seconds
+DOWNLOAD_WORKERS = 16
+HTTP_POOL_SIZE = 32
+DOWNLOAD_CHUNK_SIZE = 64 * 1024  # bytes
+HTTP_RETRIES = 5
+HTTP_BACKOFF_FACTOR = 0.5  # seconds, doubled after each retry
 USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/58.0.3029.110 Safari/537.3"
@@ -13,16 +13,38 @@ from dataclasses import dataclass
 from datetime import date
 from io import BytesIO
 from pathlib import Path
-import re
 import sqlite3
-from typing import Any, List, Optional
+from typing import Any, Iterable, Iterator, List, Optional, Sequence
 
 from PIL import Image
-import pandas as pd
 
 from src.logger import logger
 
 
+INSERT_RECORD_SQL = """
+INSERT INTO obituaries
+(image_path, text_content, obituary_url, year, month, day, date_published, name, last_name, first_name, image, content_hash)
+VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+# The single-record insert gets the new row's id back from the statement itself
+INSERT_RECORD_RETURNING_ID_SQL = INSERT_RECORD_SQL + "RETURNING id\n"
+
+# Columns written by the CSV and Excel exports (the image blob is excluded)
+EXPORT_COLUMNS = [
+    "image_path",
+    "text_content",
+    "obituary_url",
+    "year",
+    "month",
+    "day",
+    "date_published",
+    "name",
+    "last_name",
+    "first_name",
+]
+
+
 @dataclass
 class ObituaryRecord:
     """Data class to store obituary information."""
@@ -38,6 +60,7 @@ class ObituaryRecord:
     last_name: Optional[str] = None
     first_name: Optional[str] = None
     image: Optional[bytes] = None
+    content_hash: Optional[str] = None
 
     @classmethod
     def from_image_path(
@@ -69,22 +92,33 @@ class ObituaryRecord:
 
         # Resize the image to a manageable size to reduce memory usage
         max_size = (1024, 1024)  # Example maximum dimensions
-        raw_image.thumbnail(max_size)
-
-        # Compress the image and save it to an in-memory buffer
+        if raw_image.format == "JPEG":
+            # Let libjpeg scale down while decoding, so the full-resolution
+            # scan is never decoded just to be shrunk
+            raw_image.draft(raw_image.mode, max_size)
+        raw_image.thumbnail(max_size, Image.Resampling.BILINEAR)
+
+        # Compress the image and save it to an in-memory buffer. Huffman
+        # table optimization is skipped: it costs an extra encoding pass for
+        # a few percent of size on a 1024px thumbnail.
         buffer = BytesIO()
         raw_image.save(
             buffer,
             format="JPEG",
             quality=85,
-            optimize=True,
+            optimize=False,
         )  # Adjust quality as needed
         image_data = buffer.getvalue()
 
-        # If we have a pattern like YYYYMMDD_Name
-        match = re.match(r"(\d{4})(\d{2})(\d{2})_(.*)", filename)
-        if match:
-            year, month, day, name = match.groups()
+        # If we have a pattern like YYYYMMDD_Name. The prefix is fixed-width,
+        # so slicing replaces a regex match.
+        if filename[:8].isdecimal() and filename[8:9] == "_":
+            year, month, day, name = (
+                filename[:4],
+                filename[4:6],
+                filename[6:8],
+                filename[9:],
+            )
 
             # Create a date object if year, month, and day are valid
             try:
@@ -113,6 +147,32 @@ class ObituaryRecord:
         )
 
 
+def record_to_row(record: ObituaryRecord) -> tuple[Any, ...]:
+    """
+    Get the values of a record in the column order of INSERT_RECORD_SQL.
+
+    Args:
+        record: The ObituaryRecord to convert
+
+    Returns:
+        tuple: The values to bind to the insert statement
+    """
+    return (
+        record.image_path,
+        record.text_content,
+        record.obituary_url,
+        record.year,
+        record.month,
+        record.day,
+        record.date_published,
+        record.name,
+        record.last_name,
+        record.first_name,
+        record.image,
+        record.content_hash,
+    )
+
+
 class ObituaryDatabase:
     """Class to handle database operations for obituary data."""
 
@@ -124,10 +184,24 @@ class ObituaryDatabase:
             db_path: Path to the SQLite database file
         """
         self.db_path = db_path
+        # Column names per table, filled in on first use by get_columns
+        self._known_columns: dict[str, set[str]] = {}
         self.conn = sqlite3.connect(db_path, detect_types=sqlite3.PARSE_DECLTYPES)
         # Enable foreign keys
         self.conn.execute("PRAGMA foreign_keys = ON")
+        # Tune for bulk writes. In WAL mode synchronous=NORMAL cannot corrupt
+        # the database; a power loss may only drop the last few commits,
+        # which a re-run transcribes again.
+        self.conn.execute("PRAGMA journal_mode = WAL")
+        self.conn.execute("PRAGMA synchronous = NORMAL")
+        self.conn.execute("PRAGMA temp_store = MEMORY")
+        self.conn.execute("PRAGMA cache_size = -65536")  # 64 MiB
+        self.conn.execute("PRAGMA mmap_size = 268435456")  # 256 MiB
         self.create_tables()
+        # Older databases predate the date_published column; check once here
+        # rather than on every insert
+        self.add_column_if_not_exists("obituaries", "date_published", "DATE")
+        self.add_column_if_not_exists("obituaries", "content_hash", "TEXT")
         logger.info(f"Initialized database at {db_path}")
 
     def create_tables(self):
@@ -148,12 +222,113 @@ class ObituaryDatabase:
             last_name TEXT,
             first_name TEXT,
             image BLOB NOT NULL,
+            content_hash TEXT,
             created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
         )
         """
         )
+        # Transcription checks every image path before OCR. Not UNIQUE, since
+        # databases written by older versions may hold duplicate paths.
+        cursor.execute(
+            """
+        CREATE INDEX IF NOT EXISTS idx_obituaries_image_path
+        ON obituaries(image_path)
+        """
+        )
+        self.has_search_index = self.create_search_index(cursor)
         self.conn.commit()
 
+    def create_search_index(self, cursor: sqlite3.Cursor) -> bool:
+        """
+        Create the FTS5 full-text index used by search_records.
+
+        The index is an external-content table over obituaries, kept in sync
+        by triggers. When it is first added to an existing database, it is
+        built from the rows already stored.
+
+        Args:
+            cursor: The cursor to create the index with
+
+        Returns:
+            bool: True if the index is available, False if this SQLite build
+                  lacks FTS5
+        """
+        cursor.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?",
+            ("obituaries_fts",),
+        )
+        exists = cursor.fetchone() is not None
+
+        try:
+            cursor.execute(
+                """
+            CREATE VIRTUAL TABLE IF NOT EXISTS obituaries_fts USING fts5(
+                text_content,
+                name,
+                content='obituaries',
+                content_rowid='id',
+                tokenize='unicode61'
+            )
+            """
+            )
+        except sqlite3.OperationalError as e:
+            # Not every SQLite build includes FTS5; searching falls back to
+            # a table scan without it
+            if "fts5" not in str(e):
+                raise
+            logger.warning(f"Full-text search is unavailable: {e}")
+            return False
+        cursor.execute(
+            """
+        CREATE TRIGGER IF NOT EXISTS obituaries_fts_insert
+        AFTER INSERT ON obituaries BEGIN
+            INSERT INTO obituaries_fts(rowid, text_content, name)
+            VALUES (new.id, new.text_content, new.name);
+        END
+        """
+        )
+        cursor.execute(
+            """
+        CREATE TRIGGER IF NOT EXISTS obituaries_fts_delete
+        AFTER DELETE ON obituaries BEGIN
+            INSERT INTO obituaries_fts(obituaries_fts, rowid, text_content, name)
+            VALUES ('delete', old.id, old.text_content, old.name);
+        END
+        """
+        )
+        cursor.execute(
+            """
+        CREATE TRIGGER IF NOT EXISTS obituaries_fts_update
+        AFTER UPDATE OF text_content, name ON obituaries BEGIN
+            INSERT INTO obituaries_fts(obituaries_fts, rowid, text_content, name)
+            VALUES ('delete', old.id, old.text_content, old.name);
+            INSERT INTO obituaries_fts(rowid, text_content, name)
+            VALUES (new.id, new.text_content, new.name);
+        END
+        """
+        )
+
+        if not exists:
+            cursor.execute(
+                "INSERT INTO obituaries_fts(obituaries_fts) VALUES ('rebuild')"
+            )
+        return True
+
+    def get_columns(self, table_name: str) -> set[str]:
+        """
+        Get the column names of a table, reading the schema only once.
+
+        Args:
+            table_name: Name of the table
+
+        Returns:
+            set[str]: The table's column names
+        """
+        if table_name not in self._known_columns:
+            cursor = self.conn.execute(f"PRAGMA table_info({table_name})")
+            self._known_columns[table_name] = {info[1] for info in cursor}
+        return self._known_columns[table_name]
+
     def add_column_if_not_exists(
         self, table_name: str, column_name: str, column_type: str
     ):
@@ -165,18 +340,17 @@ class ObituaryDatabase:
             column_name: Name of the column to add
             column_type: SQL type of the column
         """
-        cursor = self.conn.cursor()
-
         # Check if column exists
-        cursor.execute(f"PRAGMA table_info({table_name})")
-        columns = [info[1] for info in cursor.fetchall()]
+        columns = self.get_columns(table_name)
 
         if column_name not in columns:
             logger.info(f"Adding column {column_name} to table {table_name}")
+            cursor = self.conn.cursor()
             cursor.execute(
                 f"ALTER TABLE {table_name} ADD COLUMN {column_name} {column_type}"
             )
             self.conn.commit()
+            columns.add(column_name)
 
             # If we're adding a date_published column, populate it from existing data
             if (
@@ -187,46 +361,33 @@ class ObituaryDatabase:
             ):
                 self.populate_date_published()
         else:
-            logger.debug(f"Column {column_name} already exists in table {table_name}")
+            logger.debug(
+                "Column %s already exists in table %s", column_name, table_name
+            )
 
     def populate_date_published(self):
         """
         Populate the date_published column from year, month, and day columns.
         This is used when adding the date_published column to an existing table.
         """
-        cursor = self.conn.cursor()
-
-        # Get all records with year, month, day but no date_published
-        cursor.execute(
+        # Build the dates in SQLite in a single statement. A modifier makes
+        # date() normalize its input (e.g. Feb 31 -> Mar 3) and it returns
+        # NULL for unparseable input, so keeping only dates that survive the
+        # round trip unchanged leaves rows with invalid components NULL.
+        cursor = self.conn.execute(
             """
-            SELECT id, year, month, day
-            FROM obituaries
+            UPDATE obituaries
+            SET date_published = year || '-' || month || '-' || day
             WHERE date_published IS NULL
             AND year IS NOT NULL
             AND month IS NOT NULL
             AND day IS NOT NULL
+            AND date(year || '-' || month || '-' || day, '+0 days')
+                = year || '-' || month || '-' || day
             """
         )
-
-        records = cursor.fetchall()
-        updated_count = 0
-
-        for record_id, year, month, day in records:
-            try:
-                # Create date object
-                date_obj = date(int(year), int(month), int(day))
-
-                # Update record
-                cursor.execute(
-                    "UPDATE obituaries SET date_published = ? WHERE id = ?",
-                    (date_obj, record_id),
-                )
-                updated_count += 1
-            except (ValueError, TypeError) as e:
-                logger.warning(f"Could not create date for record {record_id}: {e}")
-
         self.conn.commit()
-        logger.info(f"Updated date_published for {updated_count} records")
+        logger.info(f"Updated date_published for {cursor.rowcount} records")
 
     def add_record(self, record: ObituaryRecord) -> int:
         """
@@ -238,35 +399,32 @@ class ObituaryDatabase:
         Returns:
             int: The ID of the newly added record
         """
-        # Ensure the date_published column exists
-        self.add_column_if_not_exists("obituaries", "date_published", "DATE")
-
-        cursor = self.conn.cursor()
-        cursor.execute(
-            """
-        INSERT INTO obituaries
-        (image_path, text_content, obituary_url, year, month, day, date_published, name, last_name, first_name, image)
-        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """,
-            (
-                record.image_path,
-                record.text_content,
-                record.obituary_url,
-                record.year,
-                record.month,
-                record.day,
-                record.date_published,
-                record.name,
-                record.last_name,
-                record.first_name,
-                record.image,
-            ),
+        cursor = self.conn.execute(
+            INSERT_RECORD_RETURNING_ID_SQL, record_to_row(record)
         )
+        (record_id,) = cursor.fetchone()
         self.conn.commit()
-        logger.debug(f"Added record for {record.image_path}")
-        if cursor.lastrowid is None:
-            raise ValueError("Failed to insert record into the database.")
-        return cursor.lastrowid
+        logger.debug("Added record for %s", record.image_path)
+        return record_id
+
+    def add_records(self, records: Sequence[ObituaryRecord]) -> int:
+        """
+        Add several obituary records to the database in a single transaction.
+
+        Args:
+            records: The ObituaryRecords to add
+
+        Returns:
+            int: The number of records added
+        """
+        if not records:
+            return 0
+
+        # One transaction (and one commit) for the whole batch
+        with self.conn:
+            self.conn.executemany(INSERT_RECORD_SQL, map(record_to_row, records))
+        logger.debug("Added %d records", len(records))
+        return len(records)
 
     def get_all_records(self) -> List[ObituaryRecord]:
         """
@@ -277,7 +435,7 @@ class ObituaryDatabase:
         """
         cursor = self.conn.cursor()
         cursor.execute(
-            "SELECT image_path, text_content, obituary_url, year, month, day, date_published, name, last_name, first_name, image FROM obituaries"
+            "SELECT image_path, text_content, obituary_url, year, month, day, date_published, name, last_name, first_name, image, content_hash FROM obituaries"
         )
         rows = cursor.fetchall()
 
@@ -294,28 +452,57 @@ class ObituaryDatabase:
                 last_name=row[8],
                 first_name=row[9],
                 image=row[10],
+                content_hash=row[11],
             )
             for row in rows
         ]
 
+    def get_records_by_image_path(self) -> dict[str, ObituaryRecord]:
+        """
+        Retrieve all obituary records from the database in a single query,
+        keyed by image path.
+
+        Returns:
+            dict[str, ObituaryRecord]: The records, keyed by their image path
+        """
+        return {record.image_path: record for record in self.get_all_records()}
+
     def search_records(self, query: str) -> List[ObituaryRecord]:
         """
         Search for obituary records matching the query.
 
+        Records match when they contain every word of the query at the start
+        of a word in their text or name, so "russ" matches "Russell" but not
+        "Truss". Without FTS5 (see create_search_index), records whose text
+        or name contains the whole query as a substring match instead.
+
         Args:
             query: Search query string
 
         Returns:
             List[ObituaryRecord]: A list of matching obituary records
         """
+        # An empty query matches everything, as a substring search would
+        if not query.strip():
+            return self.get_all_records()
+
+        if self.has_search_index:
+            condition = """id IN (
+            SELECT rowid FROM obituaries_fts WHERE obituaries_fts MATCH ?
+        )"""
+            params: tuple[str, ...] = (to_fts_query(query),)
+        else:
+            condition = "text_content LIKE ? OR name LIKE ?"
+            params = (f"%{query}%", f"%{query}%")
+
         cursor = self.conn.cursor()
         cursor.execute(
-            """
-        SELECT image_path, text_content, obituary_url, year, month, day, date_published, name, last_name, first_name, image
+            f"""
+        SELECT image_path, text_content, obituary_url, year, month, day, date_published, name, last_name, first_name, image, content_hash
         FROM obituaries
-        WHERE text_content LIKE ? OR name LIKE ?
+        WHERE {condition}
         """,
-            (f"%{query}%", f"%{query}%"),
+            params,
         )
         rows = cursor.fetchall()
 
@@ -332,6 +519,7 @@ class ObituaryDatabase:
                 last_name=row[8],
                 first_name=row[9],
                 image=row[10],
+                content_hash=row[11],
             )
             for row in rows
         ]
@@ -349,7 +537,7 @@ class ObituaryDatabase:
         cursor = self.conn.cursor()
         cursor.execute(
             """
-        SELECT image_path, text_content, obituary_url, year, month, day, date_published, name, last_name, first_name, image
+        SELECT image_path, text_content, obituary_url, year, month, day, date_published, name, last_name, first_name, image, content_hash
         FROM obituaries
         WHERE image_path = ?
         """,
@@ -370,6 +558,7 @@ class ObituaryDatabase:
                 last_name=row[8],
                 first_name=row[9],
                 image=row[10],
+                content_hash=row[11],
             )
         return None
 
@@ -396,6 +585,28 @@ class ObituaryDatabase:
         self.conn.commit()
         return cursor.rowcount > 0
 
+    def _iter_export_rows(self) -> Iterator[list[Any]]:
+        """
+        Stream the exportable columns of every record, one row at a time.
+
+        The image column is left out of the query, since it contains binary
+        data and is not exported.
+
+        Yields:
+            list: The record's fields in EXPORT_COLUMNS order, with the date
+            formatted as a string
+        """
+        cursor = self.conn.execute(
+            f"SELECT {', '.join(EXPORT_COLUMNS)} FROM obituaries"
+        )
+        date_index = EXPORT_COLUMNS.index("date_published")
+        for row in cursor:
+            values = list(row)
+            # Format the date as a string if it exists
+            if values[date_index]:
+                values[date_index] = values[date_index].strftime("%B %d, %Y")
+            yield values
+
     def export_to_csv(self, output_path: str = "obituaries.csv"):
         """
         Export all obituary records to a CSV file.
@@ -403,49 +614,17 @@ class ObituaryDatabase:
         Args:
             output_path: Path to save the CSV file
         """
-        records = self.get_all_records()
-
+        count = 0
         with open(output_path, "w", newline="", encoding="utf-8") as csvfile:
-            fieldnames = [
-                "image_path",
-                "text_content",
-                "obituary_url",
-                "year",
-                "month",
-                "day",
-                "date_published",
-                "name",
-                "last_name",
-                "first_name",
-            ]
-            writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-
-            writer.writeheader()
-            for record in records:
-                # Format the date as a string if it exists
-                date_str = (
-                    record.date_published.strftime("%B %d, %Y")
-                    if record.date_published
-                    else None
-                )
-
-                writer.writerow(
-                    {
-                        "image_path": record.image_path,
-                        "text_content": record.text_content,
-                        "obituary_url": record.obituary_url,
-                        "year": record.year,
-                        "month": record.month,
-                        "day": record.day,
-                        "date_published": date_str,
-                        "name": record.name,
-                        "last_name": record.last_name,
-                        "first_name": record.first_name,
-                    }
-                    # Exclude the image field as it contains binary data and is not suitable for CSV export
-                )
-
-        logger.info(f"Exported {len(records)} records to {output_path}")
+            writer = csv.writer(csvfile)
+
+            writer.writerow(EXPORT_COLUMNS)
+            # Rows are written as the cursor yields them
+            for row in self._iter_export_rows():
+                writer.writerow(row)
+                count += 1
+
+        logger.info(f"Exported {count} records to {output_path}")
 
     def export_to_excel(self, output_path: str = "obituaries.xlsx"):
         """
@@ -454,39 +633,22 @@ class ObituaryDatabase:
         Args:
             output_path: Path to save the Excel file
         """
-        records = self.get_all_records()
+        # openpyxl is only needed for this export, so only load it when used
+        from openpyxl import Workbook
 
-        # Convert date objects to formatted strings for Excel
-        data: list[dict[str, Any]] = []
-        for record in records:
-            # Format the date as a string if it exists
-            date_str = (
-                record.date_published.strftime("%B %d, %Y")
-                if record.date_published
-                else None
-            )
+        # A write-only workbook streams rows to disk instead of holding the
+        # whole sheet in memory
+        workbook = Workbook(write_only=True)
+        sheet = workbook.create_sheet()
+        sheet.append(EXPORT_COLUMNS)
 
-            data.append(
-                {
-                    "image_path": record.image_path,
-                    "text_content": record.text_content,
-                    "obituary_url": record.obituary_url,
-                    "year": record.year,
-                    "month": record.month,
-                    "day": record.day,
-                    "date_published": date_str,
-                    "name": record.name,
-                    "last_name": record.last_name,
-                    "first_name": record.first_name,
-                    # Exclude the image field as it contains binary data
-                }
-            )
-
-        df = pd.DataFrame(data)
-        # The `# type: ignore` is used here because the `pandas` library's type stubs may not fully support the `to_excel` method.
-        df.to_excel(output_path, index=False)  # type: ignore
+        count = 0
+        for row in self._iter_export_rows():
+            sheet.append(row)
+            count += 1
+        workbook.save(output_path)
 
-        logger.info(f"Exported {len(records)} records to {output_path}")
+        logger.info(f"Exported {count} records to {output_path}")
 
     def close(self):
         """Close the database connection."""
@@ -532,6 +694,60 @@ def store_transcription(
     return record
 
 
+def store_transcriptions(
+    transcriptions: Iterable[tuple[str, str, Image.Image, Optional[str]]],
+    db: Optional[ObituaryDatabase] = None,
+    db_path: Optional[str] = None,
+) -> List[ObituaryRecord]:
+    """
+    Store several transcriptions in the database in a single transaction.
+
+    Args:
+        transcriptions: (image_path, text_content, raw_image, obituary_url) tuples
+        db: An existing ObituaryDatabase instance (optional)
+        db_path: Path to the database file (optional, used if db is not provided)
+
+    Returns:
+        List[ObituaryRecord]: The stored obituary records
+    """
+    records = [
+        ObituaryRecord.from_image_path(image_path, text_content, raw_image, url)
+        for image_path, text_content, raw_image, url in transcriptions
+    ]
+
+    if db is not None:
+        db.add_records(records)
+    elif db_path:
+        # Open the database once for the whole batch
+        db = ObituaryDatabase(db_path)
+        try:
+            db.add_records(records)
+        finally:
+            db.close()
+
+    return records
+
+
+def to_fts_query(query: str) -> str:
+    """
+    Turn a plain search string into an FTS5 query.
+
+    Each word becomes a quoted prefix match, so "russ" matches "Russell"
+    and characters with a meaning in the FTS5 syntax are searched literally.
+
+    Example:
+        Russ O'Brien => "Russ"* "O'Brien"*
+
+    Args:
+        query: The search string
+
+    Returns:
+        str: The FTS5 query matching records that contain every word
+    """
+    terms = (term.replace('"', '""') for term in query.split())
+    return " ".join(f'"{term}"*' for term in terms)
+
+
 def format_name(
     snake_case_name: str,
 ) -> tuple[Optional[str], Optional[str], Optional[str]]:
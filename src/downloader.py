@@ -1,17 +1,26 @@
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from functools import lru_cache
+from html.parser import HTMLParser
+import os
 from pathlib import Path
-import re
+from threading import Lock
 import time
-from typing import List, Optional, Sequence, Tuple
-from urllib.parse import unquote
+from typing import TYPE_CHECKING, Deque, Dict, List, Optional, Sequence, Tuple
+from urllib.parse import parse_qs, urljoin, urlsplit
 
-from playwright.sync_api import Playwright, sync_playwright
 import requests
 from requests import adapters
 import tqdm
+from urllib3.util.retry import Retry
 
 import src.config as config
 from src.logger import logger
 
+if TYPE_CHECKING:
+    from playwright.sync_api import Browser, BrowserContext, Playwright
+
 
 def ensure_directory_exists(path: str | Path) -> Path:
     """Create directory if it doesn't exist and return the Path object.
@@ -25,6 +34,8 @@ def ensure_directory_exists(path: str | Path) -> Path:
     return path
 
 
+# Cache parsed URLs so retries and re-runs do not parse them again
+@lru_cache(maxsize=4096)
 def extract_filename_from_url(obituary_url: str) -> Optional[str]:
     """
     Extract a clean filename from an obituary URL.
@@ -37,30 +48,138 @@ def extract_filename_from_url(obituary_url: str) -> Optional[str]:
     Returns:
         str | None: The extracted filename or None if extraction fails
     """
-    # Extract the name parameter
-    name_match = re.search(r"display\.jsp\?name=([^&]+)", obituary_url)
-    return None if not name_match else unquote(name_match.group(1))
+    # Extract the name parameter (parse_qs also percent-decodes it)
+    query = parse_qs(urlsplit(obituary_url).query)
+    names = query.get("name")
+    return names[0] if names else None
+
+
+class ObituaryScraper:
+    """
+    Scrape obituary links from the search page with a Playwright browser.
+
+    The browser and its context are started once on entering the context
+    manager and reused by every `scrape` call, so querying several year
+    ranges only pays for the browser startup once.
+
+    Example:
+    ```
+    with ObituaryScraper() as scraper:
+        for year in ("1991", "1992"):
+            links = scraper.scrape(year, year)
+    ```
+    """
+
+    def __init__(
+        self, playwright: Optional["Playwright"] = None, headless: bool = True
+    ) -> None:
+        """
+        Args:
+            playwright: A running Playwright instance to use, or None to start one
+            headless: Whether to run the browser without a visible window
+        """
+        self._playwright = playwright
+        self._owns_playwright = playwright is None
+        self._headless = headless
+        self._browser: Optional["Browser"] = None
+        self._context: Optional["BrowserContext"] = None
+
+    def __enter__(self) -> "ObituaryScraper":
+        if self._playwright is None:
+            # Playwright is slow to import, so only load it when it is used
+            from playwright.sync_api import sync_playwright
+
+            self._playwright = sync_playwright().start()
+        self._browser = self._playwright.chromium.launch(headless=self._headless)
+        self._context = self._browser.new_context()
+        # Only the page markup is read, so skip loading images, styles and fonts
+        self._context.route(
+            "**/*",
+            lambda route: (
+                route.abort()
+                if route.request.resource_type in config.BLOCKED_RESOURCE_TYPES
+                else route.continue_()
+            ),
+        )
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        if self._context is not None:
+            self._context.close()
+            self._context = None
+        if self._browser is not None:
+            self._browser.close()
+            self._browser = None
+        if self._owns_playwright and self._playwright is not None:
+            self._playwright.stop()
+            self._playwright = None
+
+    def scrape(self, year_from: str, year_to: str) -> List[str | None]:
+        """
+        Search the archive for a date range and return the obituary links.
+
+        A fresh page is opened for every search and closed afterwards, while
+        the browser and context stay alive for the next call.
+
+        Args:
+            year_from: The first year to search for obituaries
+            year_to: The last year to search for obituaries
+        Raises:
+            RuntimeError: If called outside the context manager
+        Returns:
+            list[str]: A list of obituary links for the specified years
+        """
+        if self._context is None:
+            raise RuntimeError("ObituaryScraper must be used as a context manager")
+
+        page = self._context.new_page()
+        try:
+            # Navigate to the search page
+            logger.info(f"Navigating to the search page...")
+            page.goto(config.SEARCH_URL)
+
+            # Set the search parameters
+            page.locator('select[name="yearfrom"]').select_option(year_from)
+            page.locator('select[name="monthto"]').select_option("12")
+            page.locator('select[name="yearto"]').select_option(year_to)
+
+            # Click the search button
+            search_button = page.get_by_role(
+                "cell",
+                name=f"Select a date range to show all obituaries in the database within that range. From: January {year_from} To: December {year_to} Search",
+                exact=True,
+            ).get_by_role("button")
+            search_button.click()
+
+            # Read every link target in a single round-trip to the browser
+            hrefs: List[str] = page.eval_on_selector_all(
+                "a[href]", "links => links.map(link => link.getAttribute('href'))"
+            )
+        finally:
+            page.close()
+
+        # Filter out the "index.jsp" link
+        return [href for href in hrefs if href != "index.jsp"]
 
 
 def run(
-    playwright: Playwright, year_from: str = "1999", year_to: str = "2000"
+    playwright: "Playwright",
+    year_from: str = "1999",
+    year_to: str = "2000",
+    headless: bool = True,
 ) -> List[str | None]:
     """
     Run the Playwright browser to scrape obituary links from the GLBT History website.
-    This function uses the Playwright library to automate the browser and extract
-    obituary links from the search page.
-
-    It navigates to the search page, sets the search parameters, and retrieves
-    the links to the obituaries for the specified year.
-    Returns a list of obituary links.
+    This is a one-off search; use `ObituaryScraper` directly to run several
+    searches in the same browser.
 
     Args:
         playwright: The Playwright instance to use for browser automation
-        year: The year to search for obituaries (default is "1991")
-    Raises:
-        ValueError: If the year is not valid
+        year_from: The first year to search for obituaries
+        year_to: The last year to search for obituaries
+        headless: Whether to run the browser without a visible window
     Returns:
-        list[str]: A list of obituary links for the specified year
+        list[str]: A list of obituary links for the specified years
     Example:
     ```
     [
@@ -70,38 +189,166 @@ def run(
     ]
 
     """
-    browser = playwright.chromium.launch(headless=False)
-    context = browser.new_context()
-    page = context.new_page()
+    with ObituaryScraper(playwright, headless=headless) as scraper:
+        return scraper.scrape(year_from, year_to)
+
+
+@dataclass
+class SearchForm:
+    """An HTML form parsed from the archive search page."""
+
+    action: str = ""
+    method: str = "get"
+    fields: Dict[str, str] = field(default_factory=dict)
+
+
+class SearchPageParser(HTMLParser):
+    """
+    Collect the forms and link targets of an archive page.
+    Only the parts needed to submit the search form and read its
+    results are kept: form actions, field defaults and `<a href>` values.
+    """
 
-    # Navigate to the search page
-    logger.info(f"Navigating to the search page...")
-    page.goto("http://obit.glbthistory.org/olo/index.jsp")
+    def __init__(self) -> None:
+        super().__init__()
+        self.forms: List[SearchForm] = []
+        self.links: List[str] = []
+        self._form: Optional[SearchForm] = None
+        self._select: Optional[str] = None
+        self._has_submit = False
+
+    def handle_starttag(self, tag: str, attrs: list[tuple[str, str | None]]) -> None:
+        attributes = {name: value or "" for name, value in attrs}
+        if tag == "a" and "href" in attributes:
+            self.links.append(attributes["href"])
+        elif tag == "form":
+            self._form = SearchForm(
+                action=attributes.get("action", ""),
+                method=attributes.get("method", "get").lower(),
+            )
+            self.forms.append(self._form)
+            self._has_submit = False
+        elif self._form is None:
+            return
+        elif tag == "input" and attributes.get("name"):
+            input_type = attributes.get("type", "text").lower()
+            if input_type in {"checkbox", "radio"} and "checked" not in attributes:
+                return
+            if input_type in {"submit", "image"}:
+                # Browsers only send the button that was clicked; keep the first
+                if self._has_submit:
+                    return
+                self._has_submit = True
+            self._form.fields[attributes["name"]] = attributes.get("value", "")
+        elif tag == "select" and attributes.get("name"):
+            self._select = attributes["name"]
+        elif tag == "option" and self._select:
+            # The first option is the default unless another one is selected
+            if self._select not in self._form.fields or "selected" in attributes:
+                self._form.fields[self._select] = attributes.get("value", "")
+
+    def handle_endtag(self, tag: str) -> None:
+        if tag == "form":
+            self._form = None
+        elif tag == "select":
+            self._select = None
+
+
+def fetch_obituary_links(
+    client: requests.Session, year_from: str = "1999", year_to: str = "2000"
+) -> List[str]:
+    """
+    Scrape obituary links by submitting the archive search form over HTTP.
+    The search page is server-rendered, so the form is read from the page
+    and submitted directly instead of driving a browser.
+
+    Args:
+        client: Configured HTTP client session
+        year_from: The first year to search for obituaries
+        year_to: The last year to search for obituaries
+    Raises:
+        ValueError: If the search form cannot be found on the page
+        requests.RequestException: If a request fails
+    Returns:
+        list[str]: A list of obituary links for the specified years
+    """
+    logger.info("Fetching the search page...")
+    response = client.get(config.SEARCH_URL, timeout=config.REQUEST_TIMEOUT)
+    response.raise_for_status()
+
+    page = SearchPageParser()
+    page.feed(response.text)
+    search_form = next((form for form in page.forms if "yearfrom" in form.fields), None)
+    if search_form is None:
+        raise ValueError(f"Failed to find the search form on {config.SEARCH_URL}")
 
     # Set the search parameters
-    page.locator('select[name="yearfrom"]').select_option(year_from)
-    page.locator('select[name="monthto"]').select_option("12")
-    page.locator('select[name="yearto"]').select_option(year_to)
-
-    # Click the search button
-    search_button = page.get_by_role(
-        "cell",
-        name=f"Select a date range to show all obituaries in the database within that range. From: January {year_from} To: December {year_to} Search",
-        exact=True,
-    ).get_by_role("button")
-    search_button.click()
-    links = page.get_by_role("link").all()
+    fields = {
+        **search_form.fields,
+        "yearfrom": year_from,
+        "monthto": "12",
+        "yearto": year_to,
+    }
+    action_url = urljoin(response.url, search_form.action)
+    if search_form.method == "post":
+        response = client.post(action_url, data=fields, timeout=config.REQUEST_TIMEOUT)
+    else:
+        response = client.get(action_url, params=fields, timeout=config.REQUEST_TIMEOUT)
+    response.raise_for_status()
+
+    results = SearchPageParser()
+    results.feed(response.text)
 
     # Filter out the "index.jsp" link
-    obituary_links = [
-        link.get_attribute("href")
-        for link in links
-        if link.get_attribute("href") != "index.jsp"
-    ]
+    return [link for link in results.links if link != "index.jsp"]
+
+
+@lru_cache(maxsize=4096)
+def resolve_obituary(display_url: str) -> Optional[Tuple[str, str]]:
+    """
+    Parse a display URL once into its filename and image URL prefix.
+    The prefix only needs the image index and extension appended to
+    become a full image URL.
+
+    Example:
+    "http://obit.glbthistory.org/olo/display.jsp?name=19910110_Alt_Russell_Darl" ->
+    ("19910110_Alt_Russell_Darl",
+     "http://obit.glbthistory.org/olo/imagedb/1991/01/10/19910110_Alt_Russell_Darl/m19910110")
+
+    Args:
+        display_url: The display URL to parse
+    Returns:
+        tuple[str, str] | None: The filename and image URL prefix,
+                                or None if the URL cannot be parsed
+    """
+    url_parts = urlsplit(display_url)
+
+    # Extract the name parameter (parse_qs also percent-decodes it)
+    names = parse_qs(url_parts.query).get("name")
+
+    # Extract date components (assuming first 8 chars are YYYYMMDD)
+    if not names or len(names[0]) < 8:
+        return None
+
+    name_param = names[0]
+    date_str, year, month, day = extract_date_components(name_param)
+
+    # Extract base domain, e.g. "http://obit.glbthistory.org/olo"
+    path_segments = url_parts.path.split("/")
+
+    if (
+        url_parts.scheme not in ("http", "https")
+        or len(path_segments) < 3
+        or not path_segments[1]
+    ):
+        return None
+
+    base_domain = f"{url_parts.scheme}://{url_parts.netloc}/{path_segments[1]}"
 
-    context.close()
-    browser.close()
-    return obituary_links
+    image_url_prefix = (
+        f"{base_domain}/imagedb/{year}/{month}/{day}/{name_param}/m{date_str}"
+    )
+    return name_param, image_url_prefix
 
 
 def transform_url_to_image_path(display_url: str, index: int = 0) -> Optional[str]:
@@ -119,32 +366,25 @@ def transform_url_to_image_path(display_url: str, index: int = 0) -> Optional[st
     Returns:
         str | None: The transformed image URL or None if the transformation fails
     """
-    # Extract the name parameter
-    name_param = extract_filename_from_url(display_url)
-
-    # Extract date components (assuming first 8 chars are YYYYMMDD)
-    if not name_param:
+    resolved = resolve_obituary(display_url)
+    if not resolved:
         return None
 
-    if len(name_param) < 8:
-        return None
-
-    date_str, year, month, day = extract_date_components(name_param)
-
-    # Extract base domain
-    base_domain_full = re.match(r"(https?://[^/]+/[^/]+)/", display_url)
-
-    if not base_domain_full:
-        return None
+    # Construct the image URL with the specified index
+    return build_image_url(resolved[1], index)
 
-    base_domain = base_domain_full.group(1)
 
-    # Construct the image URL with the specified index
-    image_url: str = (
-        f"{base_domain}/imagedb/{year}/{month}/{day}/{name_param}/m{date_str}_{index}.jpg"
-    )
+def build_image_url(image_url_prefix: str, index: int) -> str:
+    """
+    Build the image URL for an index from a prefix returned by `resolve_obituary`.
 
-    return image_url
+    Args:
+        image_url_prefix: The image URL without the index and extension
+        index: The image index to use (0, 1, or 2)
+    Returns:
+        str: The image URL
+    """
+    return f"{image_url_prefix}_{index}.jpg"
 
 
 def extract_date_components(name_param: str) -> tuple[str, str, str, str]:
@@ -165,40 +405,72 @@ def extract_date_components(name_param: str) -> tuple[str, str, str, str]:
     return date_str, year, month, day
 
 
-def bulk_download_obituaries(obituary_links: Sequence[str]) -> None:
+def bulk_download_obituaries(
+    obituary_links: Sequence[str], client: Optional[requests.Session] = None
+) -> None:
     """
     Download all obituaries from the list of links.
     This function creates a directory for saving the images and
-    iterates through the list of obituary links to download each image.
+    downloads the images concurrently on a thread pool that shares
+    a single configured HTTP session.
     Args:
         obituary_links: List of obituary links to download
+        client: A configured HTTP client session to reuse (optional).
+                A new session is created and closed if not provided.
     Raises:
         requests.RequestException: If the download fails
         IOError: If file writing fails
     """
-    # Create directory for saving images
-    save_dir = config.DATA_DIR
-    ensure_directory_exists(save_dir)
-
-    # Process each obituary:
-    for obituary_link in tqdm.tqdm(
-        obituary_links,
-        total=len(obituary_links),
-        desc="Downloading obituaries: ",
-        unit="obituary",
-    ):
+    if client is None:
         with requests.Session() as client:
             configure_http_client(client)
-            try:
-                download_obituary_image(obituary_link, client)
-            except Exception as e:
-                logger.error(f"Error processing {obituary_link}: {e}")
-                continue
+            bulk_download_obituaries(obituary_links, client)
+        return
+
+    # Create directories for saving images
+    create_year_directories(obituary_links)
+
+    executor = ThreadPoolExecutor(max_workers=config.DOWNLOAD_WORKERS)
+    try:
+        futures = [
+            executor.submit(download_obituary_image_safely, obituary_link, client)
+            for obituary_link in obituary_links
+        ]
+        # Only the main thread touches the progress bar; redraw at most twice a second
+        with tqdm.tqdm(
+            total=len(futures),
+            desc="Downloading obituaries: ",
+            unit="obituary",
+            mininterval=0.5,
+        ) as progress:
+            for _ in as_completed(futures):
+                progress.update(1)
+    finally:
+        # On Ctrl-C or any other error, drop the downloads that haven't
+        # started instead of running the whole queue first
+        executor.shutdown(cancel_futures=True)
+
+
+def download_obituary_image_safely(
+    obituary_link: str, client: requests.Session
+) -> None:
+    """
+    Download an obituary image, logging any error instead of raising it.
+    This keeps one failed obituary from cancelling the rest of the batch.
+    Args:
+        obituary_link: Link to the obituary page
+        client: Configured HTTP client session
+    """
+    try:
+        download_obituary_image(obituary_link, client)
+    except Exception as e:
+        logger.error(f"Error processing {obituary_link}: {e}")
 
 
 def prepare_file_path(filename: str) -> Path:
     """
     Prepare the file path for saving the obituary image.
+    The year directory is not created here; see `create_year_directories`.
 
     Args:
         filename: The extracted filename from the URL
@@ -206,29 +478,55 @@ def prepare_file_path(filename: str) -> Path:
     Returns:
         Path: The file path where the image should be saved
     """
+    return year_directory(filename) / f"{filename}.jpg"
+
+
+def year_directory(filename: str) -> Path:
+    """
+    Get the directory that images for the given filename are saved in.
+
+    Args:
+        filename: The extracted filename from the URL
+
+    Returns:
+        Path: The year directory, or the base directory if the year
+              can't be determined
+    """
     # Extract year from the filename to determine directory
     if len(filename) >= 4:
-        year = filename[:4]
-        # Create year directory if it doesn't exist
-        year_dir = config.DATA_DIR / year
-        ensure_directory_exists(year_dir)
-        return year_dir / f"{filename}.jpg"
-    else:
-        # Use base directory if year can't be determined
-        return config.DATA_DIR / f"{filename}.jpg"
+        return config.DATA_DIR / filename[:4]
+    return config.DATA_DIR
+
+
+def create_year_directories(obituary_links: Sequence[str]) -> None:
+    """
+    Create the year directories for all obituary links up front,
+    so the download workers do not have to check them per image.
+
+    Args:
+        obituary_links: List of obituary links to download
+    """
+    directories = {config.DATA_DIR}
+    for obituary_link in obituary_links:
+        resolved = resolve_obituary(f"{config.ARCHIVE_URL}{obituary_link}")
+        if resolved:
+            directories.add(year_directory(resolved[0]))
+
+    for directory in directories:
+        ensure_directory_exists(directory)
 
 
 def download_single_image(
-        href: str,
-        index: int,
-        file_path: Path,
-        client: requests.Session,
-        ) -> bool:
+    image_url_prefix: str,
+    index: int,
+    file_path: Path,
+    client: requests.Session,
+) -> bool:
     """
     Attempt to download a single image with the specified index.
 
     Args:
-        href: The base URL
+        image_url_prefix: The image URL prefix returned by `resolve_obituary`
         index: The image index to try
         file_path: The path where the image should be saved
         client: The HTTP client session
@@ -238,27 +536,17 @@ def download_single_image(
     """
     try:
         # Get the image URL with the specified index
-        image_url = transform_url_to_image_path(href, index)
-        if not image_url:
-            logger.warning(f"Failed to transform URL to image path with index {index}")
-            return False
-
-        # Download the image
-        contents = download_image(image_url, client)
-        if contents is None:
-            logger.warning(f"Failed to download image from URL: {image_url}")
-            return False
+        image_url = build_image_url(image_url_prefix, index)
 
         # Adjust file path for alternative indices
-        actual_file_path = file_path
-        if index > 0:
-            actual_file_path = file_path.with_stem(f"{file_path.stem}_{index}")
+        actual_file_path = indexed_file_path(file_path, index)
 
-        # Save the image
-        with open(actual_file_path, "wb") as f:
-            f.write(contents)
+        # Stream the image straight to disk
+        if not download_image(image_url, actual_file_path, client):
+            logger.warning(f"Failed to download image from URL: {image_url}")
+            return False
 
-        logger.debug(f"Downloaded {image_url} to {actual_file_path}")
+        logger.debug("Downloaded %s to %s", image_url, actual_file_path)
         return True
 
     except requests.RequestException as e:
@@ -266,12 +554,51 @@ def download_single_image(
         return False
 
 
-def try_alternative_indices(href: str, file_path: Path, client: requests.Session) -> int:
+def indexed_file_path(file_path: Path, index: int) -> Path:
+    """
+    Get the path an image with the given index is saved to.
+    Index 0 uses the base path; alternative indices get a `_<index>` suffix.
+
+    Args:
+        file_path: The base path for the obituary image
+        index: The image index
+
+    Returns:
+        Path: The path for the image with that index
+    """
+    if index > 0:
+        return file_path.with_stem(f"{file_path.stem}_{index}")
+    return file_path
+
+
+def is_already_downloaded(file_path: Path) -> bool:
+    """
+    Check whether an obituary image from an earlier run is already on disk.
+    Any non-empty image for index 0, 1 or 2 counts as downloaded.
+
+    Args:
+        file_path: The base path for the obituary image
+
+    Returns:
+        bool: True if the obituary can be skipped, False otherwise
+    """
+    for index in [0, 1, 2]:
+        try:
+            if indexed_file_path(file_path, index).stat().st_size > 0:
+                return True
+        except FileNotFoundError:
+            continue
+    return False
+
+
+def try_alternative_indices(
+    image_url_prefix: str, file_path: Path, client: requests.Session
+) -> int:
     """
     Try downloading images with alternative indices (1 and 2).
 
     Args:
-        href: The base URL
+        image_url_prefix: The image URL prefix returned by `resolve_obituary`
         file_path: The path where the image should be saved
         client: The HTTP client session
 
@@ -281,7 +608,7 @@ def try_alternative_indices(href: str, file_path: Path, client: requests.Session
     success_count = 0
 
     for index in [1, 2]:
-        if download_single_image(href, index, file_path, client):
+        if download_single_image(image_url_prefix, index, file_path, client):
             success_count += 1
 
     return success_count
@@ -291,6 +618,8 @@ def download_obituary_image(obituary_link: str, client: requests.Session) -> Non
     """
     Download an obituary image and save it to disk in the appropriate year folder.
     If index 0 fails, it will try to download both index 1 and index 2.
+    Obituaries that already have an image on disk are skipped.
+    The year folder must already exist; see `create_year_directories`.
 
     Args:
         obituary_link: Link to the obituary page
@@ -303,45 +632,58 @@ def download_obituary_image(obituary_link: str, client: requests.Session) -> Non
     """
     try:
         # Prepare the base URL
-        href = f"http://obit.glbthistory.org/olo/{obituary_link}"
+        href = f"{config.ARCHIVE_URL}{obituary_link}"
 
-        # Extract filename from URL
-        filename = extract_filename_from_url(href)
-        if not filename:
+        # Parse the filename and image URL from the link in one pass
+        resolved = resolve_obituary(href)
+        if not resolved:
             raise ValueError(f"Failed to extract filename from URL: {href}")
+        filename, image_url_prefix = resolved
 
         # Prepare file path
         file_path = prepare_file_path(filename)
 
+        # Skip obituaries downloaded by a previous run
+        if is_already_downloaded(file_path):
+            logger.debug("Skipping %s, already downloaded", filename)
+            return
+
         # First try with index 0
-        if download_single_image(href, 0, file_path, client):
+        if download_single_image(image_url_prefix, 0, file_path, client):
             return  # Success with index 0, no need to try others
 
         # If index 0 failed, try alternative indices
         logger.warning(f"Failed to download with index 0. Trying indices 1 and 2...")
-        success_count = try_alternative_indices(href, file_path, client)
+        success_count = try_alternative_indices(image_url_prefix, file_path, client)
 
         # Check if at least one alternative download succeeded
         if success_count == 0:
-            raise ValueError(f"Failed to download obituary image with any index for {filename}")
+            raise ValueError(
+                f"Failed to download obituary image with any index for {filename}"
+            )
         else:
-            logger.info(f"Successfully downloaded {success_count} alternative images for {filename}")
+            logger.info(
+                f"Successfully downloaded {success_count} alternative images for {filename}"
+            )
 
     except Exception as e:
         logger.error(f"Failed to download obituary image: {e}")
         raise
 
 
-def download_image(image_url: str, client: requests.Session) -> Optional[bytes]:
+def download_image(image_url: str, file_path: Path, client: requests.Session) -> bool:
     """
     Download the image from the given URL using the provided HTTP client.
-    This function handles the actual HTTP request and response.
+    The response body is streamed in chunks to a `.part` file next to
+    `file_path`, which is moved into place only once the download completes,
+    so an interrupted download never leaves a truncated image behind.
 
     Args:
         image_url: URL of the image to download
+        file_path: The path where the image should be saved
         client: Configured HTTP client session
     Returns:
-        bytes: The content of the downloaded image
+        bool: True if the image was saved, False if the URL is invalid
     Raises:
         requests.RequestException: If the download fails
         IOError: If file writing fails
@@ -349,22 +691,68 @@ def download_image(image_url: str, client: requests.Session) -> Optional[bytes]:
     # Ensure the URL is valid
     if not image_url.startswith("http"):
         logger.error(f"Invalid URL: {image_url}")
-        return None
+        return False
+    partial_path = file_path.with_suffix(".part")
     try:
-        response = client.get(
+        rate_limiter.acquire()  # Rate limit to avoid overwhelming the server
+        with client.get(
             image_url,
+            stream=True,
             timeout=config.REQUEST_TIMEOUT,
-        )
-        time.sleep(
-            config.RATE_LIMIT_DELAY
-        )  # Rate limit to avoid overwhelming the server
-        response.raise_for_status()
-        return response.content
-    except requests.RequestException as e:
-        logger.error(f"Failed to download {image_url}: {e}")
+        ) as response:
+            response.raise_for_status()
+            with open(partial_path, "wb") as f:
+                for chunk in response.iter_content(config.DOWNLOAD_CHUNK_SIZE):
+                    f.write(chunk)
+        os.replace(partial_path, file_path)
+        return True
+    except BaseException as e:
+        # Also covers Ctrl-C mid-stream
+        if isinstance(e, requests.RequestException):
+            logger.error(f"Failed to download {image_url}: {e}")
+        partial_path.unlink(missing_ok=True)
         raise
 
 
+class RateLimiter:
+    """
+    Thread-safe sliding-window rate limiter.
+    Allows at most `rate` calls to `acquire` in any `per`-second window,
+    counted across all threads that share the limiter.
+    """
+
+    def __init__(self, rate: int, per: float) -> None:
+        """
+        Initialize the rate limiter.
+
+        Args:
+            rate: Maximum number of calls allowed per window
+            per: Length of the window in seconds
+        """
+        self.rate = rate
+        self.per = per
+        self.calls: Deque[float] = deque()
+        self.lock = Lock()
+
+    def acquire(self) -> None:
+        """Block until a call is allowed, then record it."""
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                # Drop timestamps that have left the window
+                while self.calls and now - self.calls[0] >= self.per:
+                    self.calls.popleft()
+                if len(self.calls) < self.rate:
+                    self.calls.append(now)
+                    return
+                delay = self.per - (now - self.calls[0])
+            time.sleep(delay)
+
+
+# Shared by all download threads so the global request rate is bounded
+rate_limiter = RateLimiter(config.RATE_LIMIT_REQUESTS, config.RATE_LIMIT_PERIOD)
+
+
 def build_image_download_path(obituary_link: str) -> Tuple[Path, str]:
     """
     Build the image download path and URL for a given obituary link.
@@ -386,11 +774,21 @@ def configure_http_client(client: requests.Session) -> None:
     """
     Configure the HTTP client with a custom adapter and headers.
     This is used to set up connection pooling and other settings.
+    Transient server and connection errors are retried with exponential backoff.
     Args:
         client: The HTTP client session to configure
     """
+    retry = Retry(
+        total=config.HTTP_RETRIES,
+        backoff_factor=config.HTTP_BACKOFF_FACTOR,
+        status_forcelist=(500, 502, 503, 504),
+        allowed_methods=("GET", "HEAD"),
+    )
     adapter = adapters.HTTPAdapter(
-        pool_connections=25, pool_maxsize=25, pool_block=True
+        pool_connections=config.HTTP_POOL_SIZE,
+        pool_maxsize=config.HTTP_POOL_SIZE,
+        pool_block=True,
+        max_retries=retry,
     )
     client.mount("http://", adapter)
     client.mount("https://", adapter)
@@ -401,12 +799,28 @@ def configure_http_client(client: requests.Session) -> None:
     )
 
 
-def download_obituaries(year_from: str, year_to: str) -> None:
+def download_obituaries(
+    year_from: str,
+    year_to: str,
+    use_browser: bool = False,
+    show_browser: bool = False,
+) -> None:
     """
     Main function to download obituaries.
-    This function initializes the Playwright browser, scrapes the obituary links,
-    and downloads the images for each obituary.
+    This function scrapes the obituary links, either over plain HTTP or
+    with the Playwright browser, and downloads the images for each obituary.
+    Args:
+        year_from: The first year to download obituaries for
+        year_to: The last year to download obituaries for
+        use_browser: Whether to run the search in a Playwright browser
+        show_browser: Whether to show the Playwright browser window
     """
-    with sync_playwright() as playwright:
-        obituary_links = run(playwright, year_from, year_to)
-        bulk_download_obituaries(obituary_links)  # type: ignore
+    # One session serves the search and every image download
+    with requests.Session() as client:
+        configure_http_client(client)
+        if use_browser:
+            with ObituaryScraper(headless=not show_browser) as scraper:
+                obituary_links = scraper.scrape(year_from, year_to)
+        else:
+            obituary_links = fetch_obituary_links(client, year_from, year_to)  # type: ignore
+        bulk_download_obituaries(obituary_links, client)  # type: ignore
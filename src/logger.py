@@ -1,20 +1,42 @@
 # logger.py
 import logging
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+import multiprocessing
+from multiprocessing.queues import Queue
+from typing import Tuple
 
-from src.config import LOG_DIR
+from src.config import LOG_BACKUP_COUNT, LOG_DIR, LOG_MAX_BYTES
+
+LOGGER_NAME = "obit_transcriber"
 
 
 def setup_logger(name: str) -> logging.Logger:
     """Set up a logger with appropriate format and handlers."""
     logger = logging.getLogger(name)
+    # Already set up (e.g. the module was reloaded); adding handlers again
+    # would write every line more than once
+    if logger.handlers:
+        return logger
     logger.setLevel(logging.INFO)
+    # The handlers below cover every message; don't repeat them via the root
+    logger.propagate = False
+
+    # Worker processes re-import this module under the spawn start method.
+    # Only the main process may open the log file, or rotation breaks;
+    # workers log through the main process, see init_worker_logging.
+    if multiprocessing.parent_process() is not None:
+        return logger
 
     # Create log directory if it doesn't exist
     log_dir = LOG_DIR
     log_dir.mkdir(exist_ok=True)
 
-    # File handler
-    file_handler = logging.FileHandler(log_dir / f"{name}.log")
+    # File handler, rotated so long scrapes don't grow the log without bound
+    file_handler = RotatingFileHandler(
+        log_dir / f"{name}.log",
+        maxBytes=LOG_MAX_BYTES,
+        backupCount=LOG_BACKUP_COUNT,
+    )
     file_handler.setLevel(logging.DEBUG)
 
     # Console handler
@@ -35,4 +57,45 @@ def setup_logger(name: str) -> logging.Logger:
     return logger
 
 
-logger = setup_logger("obit_transcriber")
+def start_worker_log_listener(
+    name: str = LOGGER_NAME,
+) -> Tuple["Queue[logging.LogRecord]", QueueListener]:
+    """
+    Start passing records logged by worker processes to this process's handlers.
+    Pass the queue to `init_worker_logging` in each worker, and stop the
+    listener once the workers have exited.
+
+    Args:
+        name: Name of the logger whose handlers write the records
+
+    Returns:
+        tuple[Queue, QueueListener]: The queue for the workers and its listener
+    """
+    queue: "Queue[logging.LogRecord]" = multiprocessing.Queue()
+    listener = QueueListener(
+        queue, *logging.getLogger(name).handlers, respect_handler_level=True
+    )
+    listener.start()
+    return queue, listener
+
+
+def init_worker_logging(
+    queue: "Queue[logging.LogRecord]", name: str = LOGGER_NAME
+) -> None:
+    """
+    Send a worker process's log records to the main process.
+    Used as a process pool initializer. Handlers inherited from a forked
+    parent are replaced, so only the main process writes the log file.
+
+    Args:
+        queue: The queue returned by `start_worker_log_listener`
+        name: Name of the logger to redirect
+    """
+    worker_logger = logging.getLogger(name)
+    for handler in list(worker_logger.handlers):
+        worker_logger.removeHandler(handler)
+        handler.close()
+    worker_logger.addHandler(QueueHandler(queue))
+
+
+logger = setup_logger(LOGGER_NAME)
@@ -1,6 +1,6 @@
 from dataclasses import dataclass, field
 import re
-from typing import Dict, Pattern
+from typing import Dict, FrozenSet, Match, Pattern
 
 from src.logger import logger
 
@@ -13,51 +13,58 @@ class TextNormalizer:
     """
 
     # Compiled pattern dictionaries (initialized in __post_init__)
-    ocr_corrections: Dict[Pattern[str], str] = field(default_factory=dict)
-    hyphenation_fixes: Dict[Pattern[str], str] = field(default_factory=dict)
-    year_fixes: Dict[Pattern[str], str] = field(default_factory=dict)
-    character_removals: Dict[Pattern[str], str] = field(default_factory=dict)
-    whitespace_fixes: Dict[Pattern[str], str] = field(default_factory=dict)
-    quote_fixes: Dict[Pattern[str], str] = field(default_factory=dict)
+    ocr_corrections: Dict[str, str] = field(default_factory=dict)
+    year_fixes: Dict[str, str] = field(default_factory=dict)
+    ocr_error_pattern: Pattern[str] = field(init=False, repr=False)
+    hyphenation_pattern: Pattern[str] = field(init=False, repr=False)
+    character_removals: Dict[int, None] = field(default_factory=dict)
+    character_and_quote_fixes: Dict[int, str | None] = field(default_factory=dict)
+    quote_fixes: Dict[int, str] = field(default_factory=dict)
+    ocr_trigger_chars: FrozenSet[str] = field(init=False, repr=False)
 
     def __post_init__(self):
         """Initialize and compile all regex patterns"""
-        # OCR digit-to-letter corrections (common OCR errors)
-        ocr_corrections = {
-            r"([a-zA-Z])4([a-zA-Z])": r"\1a\2",  # '4' between letters → 'a'
-            r"([a-zA-Z])1([a-zA-Z])": r"\1l\2",  # '1' between letters → 'l'
-            r"([a-zA-Z])0([a-zA-Z])": r"\1o\2",  # '0' between letters → 'o'
-            r"([a-zA-Z])5([a-zA-Z])": r"\1s\2",  # '5' between letters → 's'
+        # OCR digit-to-letter corrections between letters (common OCR errors)
+        self.ocr_corrections = {
+            "4": "a",  # '4' between letters → 'a'
+            "1": "l",  # '1' between letters → 'l'
+            "0": "o",  # '0' between letters → 'o'
+            "5": "s",  # '5' between letters → 's'
         }
-        self.ocr_corrections = {re.compile(k): v for k, v in ocr_corrections.items()}
-
-        # Fix hyphenated words at line breaks
-        self.hyphenation_fixes = {re.compile(r"(\w+)-\s*\n\s*(\w+)"): r"\1\2"}
 
         # Fix year abbreviations
-        year_fixes = {
-            r"'9o": "'90",
-            r"'8o": "'80",
-            r"'7o": "'70",
-            r"'6o": "'60",
+        self.year_fixes = {
+            "'9o": "'90",
+            "'8o": "'80",
+            "'7o": "'70",
+            "'6o": "'60",
         }
-        self.year_fixes = {re.compile(k): v for k, v in year_fixes.items()}
 
-        # Characters to remove
-        self.character_removals = {re.compile(r"[§|•~`]"): ""}
+        # Both tables are applied in a single pass through one alternation
+        digits = "".join(self.ocr_corrections)
+        years = "|".join(re.escape(year) for year in self.year_fixes)
+        # Every match contains a digit, so text without these can be skipped
+        self.ocr_trigger_chars = frozenset(
+            char for char in digits + "".join(self.year_fixes) if char.isdigit()
+        )
+        self.ocr_error_pattern = re.compile(
+            rf"(?<=[a-zA-Z])(?P<digit>[{digits}])(?=[a-zA-Z])|(?P<year>{years})"
+        )
 
-        # Whitespace normalization
-        self.whitespace_fixes = {
-            re.compile(r" +"): " ",
-            re.compile(r"\r\n"): "\n",
-            re.compile(r"\r"): "\n",
-        }
+        # Hyphens splitting a word across line breaks. clean_text strips the
+        # lines first, so only newlines can sit between the two halves; the
+        # lookarounds keep the words themselves out of the match.
+        self.hyphenation_pattern = re.compile(r"(?<=\w)-\n+(?=\w)")
 
-        # Quote glyph normalization
-        self.quote_fixes = {re.compile(r"[\"`´]"): "'"}
+        # Characters to remove, as a str.translate table
+        self.character_removals = str.maketrans("", "", "§|•~`")
 
-        # Paragraph normalization - only included if needed
-        self.paragraph_fixes = {re.compile(r"\n(?!<PARAGRAPH>)"): "\n"}
+        # The same removals plus quote glyph normalization, so clean_text
+        # handles both in a single translate pass
+        self.character_and_quote_fixes = str.maketrans('"´', "''", "§|•~`")
+
+        # Quote glyph normalization, as a str.translate table
+        self.quote_fixes = str.maketrans('"`´', "'''")
 
     def apply_patterns(self, text: str, pattern_dict: Dict[Pattern[str], str]) -> str:
         """Apply a dictionary of compiled patterns to the text."""
@@ -68,40 +75,43 @@ class TextNormalizer:
 
     def normalize_line_endings(self, text: str) -> str:
         """Normalize all line endings to '\n'."""
-        return self.apply_patterns(
-            text,
-            {
-                re.compile(r"\r\n"): "\n",
-                re.compile(r"\r"): "\n",
-            },
-        )
+        if "\r" not in text:
+            return text
+        return text.replace("\r\n", "\n").replace("\r", "\n")
 
     def strip_lines(self, text: str) -> str:
         """Strip whitespace from each line."""
-        lines = (line.strip() for line in text.split("\n"))
-        return "\n".join(lines)
-
-    def normalize_whitespace(self, text: str) -> str:
-        """Normalize whitespace within lines."""
-        logger.debug(f"Normalizing whitespace for text of length {len(text)}")
+        return "\n".join([line.strip() for line in text.split("\n")])
 
-        # Split into lines and strip
-        lines = [line.strip() for line in text.splitlines()]
+    def normalize_whitespace(self, text: str, normalize_quotes: bool = True) -> str:
+        """Normalize whitespace within lines, and quote glyphs if requested."""
+        logger.debug("Normalizing whitespace for text of length %d", len(text))
 
-        # Normalize spaces within each line
-        lines = [self.apply_patterns(line, {re.compile(r" +"): " "}) for line in lines]
+        if normalize_quotes:
+            text = text.translate(self.quote_fixes)
 
-        # Normalize quotes
-        lines = [self.apply_patterns(line, self.quote_fixes) for line in lines]
+        # Splitting on whitespace strips each line and collapses the runs
+        # inside it to single spaces
+        lines = (" ".join(line.split()) for line in text.splitlines())
 
-        logger.debug(f"Whitespace normalization complete, result length: {len(lines)}")
-        return "\n".join(lines)
+        result = "\n".join(lines)
+        logger.debug(
+            "Whitespace normalization complete, result length: %d", len(result)
+        )
+        return result
 
     def fix_ocr_errors(self, text: str) -> str:
         """Fix common OCR errors like digit/letter confusion."""
-        text = self.apply_patterns(text, self.ocr_corrections)
-        text = self.apply_patterns(text, self.year_fixes)
-        return text
+        if self.ocr_trigger_chars.isdisjoint(text):
+            return text
+        return self.ocr_error_pattern.sub(self._replace_ocr_error, text)
+
+    def _replace_ocr_error(self, match: Match[str]) -> str:
+        """Return the replacement for a match of `ocr_error_pattern`."""
+        digit = match.group("digit")
+        if digit:
+            return self.ocr_corrections[digit]
+        return self.year_fixes[match.group("year")]
 
     def clean_text(self, text: str, normalize_quotes: bool = True) -> str:
         """
@@ -117,7 +127,7 @@ class TextNormalizer:
         if not text:
             return text
 
-        logger.debug(f"Cleaning text of length {len(text)}")
+        logger.debug("Cleaning text of length %d", len(text))
 
         # Normalize line endings
         text = self.normalize_line_endings(text)
@@ -126,20 +136,21 @@ class TextNormalizer:
         text = self.strip_lines(text)
 
         # Fix hyphenated words at line breaks
-        text = self.apply_patterns(text, self.hyphenation_fixes)
+        if "-\n" in text:
+            text = self.hyphenation_pattern.sub("", text)
 
         # Fix OCR errors (digit/letter confusion)
         text = self.fix_ocr_errors(text)
 
-        # Remove unwanted characters
-        text = self.apply_patterns(text, self.character_removals)
-
-        # Normalize whitespace within lines
-        text = self.normalize_whitespace(text)
-
-        # Apply quote normalization if requested
+        # Remove unwanted characters, normalizing quotes in the same pass if
+        # requested
         if normalize_quotes:
-            text = self.apply_patterns(text, self.quote_fixes)
+            text = text.translate(self.character_and_quote_fixes)
+        else:
+            text = text.translate(self.character_removals)
+
+        # Normalize whitespace within lines (quotes are already handled)
+        text = self.normalize_whitespace(text, normalize_quotes=False)
 
-        logger.debug(f"Text cleaning complete, result length: {len(text)}")
+        logger.debug("Text cleaning complete, result length: %d", len(text))
         return text
@@ -1,107 +1,195 @@
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+import hashlib
+from logging.handlers import QueueListener
+import os
 from pathlib import Path
+from typing import Iterable, Optional
 
 from PIL import Image, UnidentifiedImageError
-import cv2
 import pytesseract
 from tqdm import tqdm
 
 from src.autocorrection import autocorrect_text
-from src.config import TESSERACT_CONFIG
+from src.config import DB_BATCH_SIZE, OCR_WORKERS, TESSERACT_CONFIG
 from src.database import ObituaryDatabase, ObituaryRecord
-from src.logger import logger
+from src.logger import init_worker_logging, logger, start_worker_log_listener
 from src.preprocessing import preprocess_image
 from src.textnormalizer import TextNormalizer
 
+# One normalizer per process; its patterns are compiled once on import
+normalizer = TextNormalizer()
+
 
 def transcribe_images(
     filepath: str | Path,
     spellcheck: bool = False,
     db_path: str = "obituaries.db",
+    workers: Optional[int] = OCR_WORKERS,
 ) -> list[ObituaryRecord]:
     """
     Transcribes text from images in a given directory using Tesseract OCR.
+    Images are transcribed in parallel on a process pool, since OCR is
+    CPU-bound; records are stored in the database by the calling process.
     Args:
         filepath (str): Path to the directory containing images
         spellcheck (bool): Whether to perform spell checking on the extracted text
         db_path (str): Path to the SQLite database file
+        workers (int | None): Number of worker processes (defaults to the CPU count)
     Returns:
         list[ObituaryRecord]: List of processed obituary records
     """
     # Initialize database once
-    normalizer = TextNormalizer()
     db = ObituaryDatabase(db_path)
     processed_records: list[ObituaryRecord] = []
+    # New records are stored in batches, one transaction per batch
+    batch: list[ObituaryRecord] = []
 
-    directory = list(Path(filepath).rglob("*.jpg"))
-    for file in tqdm(
-        directory,
-        total=len(directory),
-        desc="Transcribing obituaries: ",
-        unit="obituary",
-    ):
-
+    # Load the stored records once, rather than querying for every file.
+    # Records are stored under the image's file name.
+    existing_records = db.get_records_by_image_path()
+    # Images already transcribed under another name are found by content
+    existing_by_hash = {
+        record.content_hash: record
+        for record in existing_records.values()
+        if record.content_hash
+    }
+    pending: list[Path] = []
+    pending_hashes: list[Optional[str]] = []
+    for file in Path(filepath).rglob("*.jpg"):
         # Check if the file is already in the database
-        existing_record = db.get_record_by_image_path(str(file))
+        existing_record = existing_records.get(file.name)
         if existing_record:
             processed_records.append(existing_record)
             continue
 
-        # Preprocess the image
         try:
-            processed_img = preprocess_image(file)
-            temp_file: str = "temp_processed.jpg"
-            cv2.imwrite(temp_file, processed_img)
-        except ValueError as e:
-            logger.error(f"Error preprocessing {file}: {e}")
-            continue
+            content_hash: Optional[str] = file_content_hash(file)
+        except OSError as e:
+            # Leave the file to transcribe_image, which logs and skips
+            # files it can't read
+            logger.warning(f"Failed to hash {file}: {e}")
+            content_hash = None
 
-        try:
-            with Image.open(temp_file) as temp_img:
-                # Extract text
-                process_obituary_image(
-                    db,
-                    normalizer,
-                    processed_records,
-                    file,
-                    temp_img,
-                    Image.open(file),
-                    spellcheck=spellcheck,
-                )
-
-        except UnidentifiedImageError:
-            continue
-        except Exception as e:
-            logger.error(f"Error processing {file}: {e}")
-            continue
-    # Close database connection
-    db.close()
+        existing_record = existing_by_hash.get(content_hash) if content_hash else None
+        if existing_record:
+            # Reuse the stored text, but store it under this file's name so
+            # the next run finds it without hashing
+            record = copy_record_for_image(existing_record, file)
+            if record:
+                record.content_hash = content_hash
+                batch.append(record)
+                processed_records.append(record)
+                continue
+        pending.append(file)
+        pending_hashes.append(content_hash)
+
+    workers = workers or os.cpu_count() or 1
+    transcribe = partial(transcribe_image, spellcheck=spellcheck)
+    executor: Optional[ProcessPoolExecutor] = None
+    log_listener: Optional[QueueListener] = None
+    records: Iterable[Optional[ObituaryRecord]]
+    if workers > 1 and len(pending) > 1:
+        # Workers log through this process, which alone writes the log file
+        log_queue, log_listener = start_worker_log_listener()
+        executor = ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=init_worker_logging,
+            initargs=(log_queue,),
+        )
+        records = executor.map(transcribe, pending, chunksize=4)
+    else:
+        records = map(transcribe, pending)
+
+    try:
+        # Records come back in the order of pending, and so of pending_hashes
+        for content_hash, record in zip(
+            pending_hashes,
+            tqdm(
+                records,
+                total=len(pending),
+                desc="Transcribing obituaries: ",
+                unit="obituary",
+            ),
+        ):
+            if record is None:
+                continue
+            record.content_hash = content_hash
+            batch.append(record)
+            processed_records.append(record)
+            if len(batch) >= DB_BATCH_SIZE:
+                db.add_records(batch)
+                batch.clear()
+    finally:
+        if executor:
+            executor.shutdown(cancel_futures=True)
+        if log_listener:
+            log_listener.stop()
+        # Store whatever finished before the loop ended
+        db.add_records(batch)
+        # Close database connection
+        db.close()
 
     return processed_records
 
 
+def transcribe_image(file: Path, spellcheck: bool = False) -> Optional[ObituaryRecord]:
+    """
+    Preprocesses and transcribes a single obituary image.
+    This runs in a worker process, so errors are logged rather than raised.
+    Args:
+        file (Path): The file path of the image
+        spellcheck (bool): Whether to perform spell checking on the extracted text
+    Returns:
+        ObituaryRecord | None: The transcribed record, or None if the image failed
+    """
+    # Preprocess the image
+    try:
+        processed_img = preprocess_image(file)
+    except (ValueError, OSError) as e:
+        logger.error(f"Error preprocessing {file}: {e}")
+        return None
+
+    try:
+        # Hand the preprocessed array to Tesseract without a temporary file
+        with Image.open(file) as raw_img, Image.fromarray(processed_img) as processed:
+            # Extract text
+            return process_obituary_image(
+                normalizer,
+                file,
+                processed,
+                raw_img,
+                spellcheck=spellcheck,
+            )
+
+    except UnidentifiedImageError:
+        return None
+    except Exception as e:
+        logger.error(f"Error processing {file}: {e}")
+        return None
+
+
 def process_obituary_image(
-    db: ObituaryDatabase,
     normalizer: TextNormalizer,
-    processed_records: list[ObituaryRecord],
     file: Path,
-    temp_img: Image.Image,
+    processed_img: Image.Image,
     raw_img: Image.Image,
     spellcheck: bool = False,
-) -> None:
+) -> ObituaryRecord:
     """
-    Processes the image to extract text and create a record in the database.
+    Processes the image to extract text and create a record for the database.
     Args:
-        db (ObituaryDatabase): The database instance
-        processed_records (list[ObituaryRecord]): List to store processed records
+        normalizer (TextNormalizer): The normalizer used to clean the text
         file (Path): The file path of the image
-        temp_img (Image.Image): The preprocessed image
+        processed_img (Image.Image): The preprocessed image
+        raw_img (Image.Image): The original image
         spellcheck (bool): Whether to perform spell checking on the extracted text
 
     Returns:
-        None
+        ObituaryRecord: The record for the transcribed image
     """
     text: str = pytesseract.image_to_string(  # type: ignore
-        temp_img,
+        processed_img,
         lang="eng",
         config=TESSERACT_CONFIG,
     )
@@ -110,15 +198,54 @@ def process_obituary_image(
         text = autocorrect_text(text)
     obituary_url = get_obituary_url(file)
 
-    # Create and store record
-    record = ObituaryRecord.from_image_path(
+    # Create the record
+    return ObituaryRecord.from_image_path(
         image_path=str(file.name),
         text_content=text,
         raw_image=raw_img,
         obituary_url=obituary_url,
     )
-    db.add_record(record)
-    processed_records.append(record)
+
+
+def copy_record_for_image(
+    record: ObituaryRecord, file: Path
+) -> Optional[ObituaryRecord]:
+    """
+    Creates a record for an image with the same contents as a stored one.
+    The transcribed text is reused; the name, date, URL and thumbnail
+    come from the new file.
+    Args:
+        record (ObituaryRecord): The stored record for the same image contents
+        file (Path): The file path of the image
+    Returns:
+        ObituaryRecord | None: The new record, or None if the image can't be read
+    """
+    try:
+        with Image.open(file) as raw_img:
+            return ObituaryRecord.from_image_path(
+                image_path=str(file.name),
+                text_content=record.text_content,
+                raw_image=raw_img,
+                obituary_url=get_obituary_url(file),
+            )
+    except OSError as e:
+        logger.warning(f"Failed to read {file}, transcribing it instead: {e}")
+        return None
+
+
+def file_content_hash(file: Path) -> str:
+    """
+    Hashes the contents of an image file.
+    Args:
+        file (Path): The file path of the image
+    Returns:
+        str: The hex digest of the file's 128-bit BLAKE2b hash
+    """
+    with open(file, "rb") as image_file:
+        digest = hashlib.file_digest(
+            image_file, lambda: hashlib.blake2b(digest_size=16)
+        )
+    return digest.hexdigest()
 
 
 def get_obituary_url(file: Path) -> str:
@@ -1,4 +1,17 @@
-from src.autocorrection import autocorrect_text, cached_correction
+import os
+from pathlib import Path
+import pickle
+from unittest.mock import patch
+
+import pytest
+
+from src.autocorrection import (
+    SpellCheckerSingleton,
+    autocorrect_text,
+    cached_correction,
+    get_spell_checker,
+    split_trailing_punctuation,
+)
 
 
 def test_autocorrect_empty_text():
@@ -73,3 +86,95 @@ def test_cached_correction_with_punctuation():
 def test_cached_correction_case_sensitivity():
     # Assuming "Corect" is corrected to "Correct"
     assert cached_correction("Corect") == "Correct"
+
+
+def test_autocorrect_skips_short_and_non_alphabetic_words():
+    text = "ot he1p t#st."
+    assert autocorrect_text(text) == text
+
+
+def test_spell_checker_unknown_returns_misspelled_words():
+    spell_checker = get_spell_checker()
+    assert spell_checker.unknown(["this", "sentnce", "erors"]) == {"sentnce", "erors"}
+
+
+@pytest.mark.parametrize(
+    "token, expected",
+    [
+        ("word", ("word", "")),
+        ("word.", ("word", ".")),
+        ("(word)!", ("(word", ")!")),
+        ("!!!", ("", "!!!")),
+    ],
+)
+def test_split_trailing_punctuation(token: str, expected: tuple[str, str]):
+    assert split_trailing_punctuation(token) == expected
+
+
+def test_get_spell_checker_returns_shared_instance():
+    assert get_spell_checker() is get_spell_checker()
+
+
+def test_spell_checker_is_cached_on_disk(tmp_path: Path):
+    word_file = tmp_path / "valid_words.txt"
+    word_file.write_text("glbt\n")
+
+    SpellCheckerSingleton(str(word_file))
+    assert (tmp_path / "valid_words.pkl").exists()
+
+    with patch.object(SpellCheckerSingleton, "_build") as mock_build:
+        cached = SpellCheckerSingleton(str(word_file))
+
+    mock_build.assert_not_called()
+    assert cached.is_known("glbt")
+
+
+def test_spell_checker_cache_is_rebuilt_when_word_file_changes(tmp_path: Path):
+    word_file = tmp_path / "valid_words.txt"
+    word_file.write_text("glbt\n")
+    SpellCheckerSingleton(str(word_file))
+
+    word_file.write_text("glbt\nlgbtq\n")
+    cache_mtime = (tmp_path / "valid_words.pkl").stat().st_mtime
+    os.utime(word_file, (cache_mtime + 1, cache_mtime + 1))
+
+    assert SpellCheckerSingleton(str(word_file)).is_known("lgbtq")
+
+
+def test_spell_checker_cache_is_rebuilt_when_word_file_size_changes(tmp_path: Path):
+    word_file = tmp_path / "valid_words.txt"
+    word_file.write_text("glbt\n")
+    SpellCheckerSingleton(str(word_file))
+
+    # An edit that keeps the old modification time is still noticed
+    original_stat = word_file.stat()
+    word_file.write_text("glbt\nlgbtq\n")
+    os.utime(word_file, ns=(original_stat.st_atime_ns, original_stat.st_mtime_ns))
+
+    assert SpellCheckerSingleton(str(word_file)).is_known("lgbtq")
+
+
+def test_spell_checker_cache_is_rebuilt_for_new_pyspellchecker(tmp_path: Path):
+    word_file = tmp_path / "valid_words.txt"
+    word_file.write_text("glbt\n")
+    SpellCheckerSingleton(str(word_file))
+
+    with patch("src.autocorrection.spellchecker.__version__", "0.0.0"):
+        SpellCheckerSingleton(str(word_file))
+
+    # The cache was rebuilt and now records the new version
+    with open(tmp_path / "valid_words.pkl", "rb") as f:
+        (version, _, _), _ = pickle.load(f)
+    assert version == "0.0.0"
+
+
+def test_spell_checker_cache_is_next_to_word_file(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+):
+    (tmp_path / "valid_words.txt").write_text("glbt\n")
+    monkeypatch.chdir(tmp_path)
+
+    spell_checker = SpellCheckerSingleton("valid_words.txt")
+
+    assert spell_checker._cache_file == tmp_path.resolve() / "valid_words.pkl"
+    assert spell_checker._cache_file.exists()
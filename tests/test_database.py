@@ -0,0 +1,251 @@
+import csv
+from datetime import date
+from io import BytesIO
+from pathlib import Path
+import sqlite3
+from typing import Any
+
+from PIL import Image
+import pytest  # type: ignore
+
+from src.database import (
+    EXPORT_COLUMNS,
+    ObituaryDatabase,
+    ObituaryRecord,
+    store_transcriptions,
+)
+
+
+@pytest.fixture
+def db(tmp_path: Path):
+    database = ObituaryDatabase(str(tmp_path / "obituaries.db"))
+    yield database
+    database.close()
+
+
+def make_record(name: str) -> ObituaryRecord:
+    return ObituaryRecord(
+        image_path=f"obituaries/1991/{name}.jpg",
+        text_content=f"Obituary of {name}",
+        image=b"jpeg",
+    )
+
+
+def test_add_record_returns_id(db: ObituaryDatabase):
+    record_id = db.add_record(make_record("19910110_Alt_Russell_Darl"))
+
+    assert record_id == 1
+    stored = db.get_record_by_image_path(
+        "obituaries/1991/19910110_Alt_Russell_Darl.jpg"
+    )
+    assert stored is not None
+    assert stored.text_content == "Obituary of 19910110_Alt_Russell_Darl"
+
+
+def test_add_records_inserts_batch(db: ObituaryDatabase):
+    records = [make_record(f"1991011{day}_Name") for day in range(3)]
+
+    assert db.add_records(records) == 3
+    assert [r.image_path for r in db.get_all_records()] == [
+        r.image_path for r in records
+    ]
+
+
+def test_add_records_empty_batch(db: ObituaryDatabase):
+    assert db.add_records([]) == 0
+    assert db.get_all_records() == []
+
+
+def test_database_uses_wal_journal(db: ObituaryDatabase):
+    (journal_mode,) = db.conn.execute("PRAGMA journal_mode").fetchone()
+    assert journal_mode == "wal"
+
+
+def test_export_to_csv_streams_rows_without_images(
+    db: ObituaryDatabase, tmp_path: Path
+):
+    record = make_record("19910110_Alt_Russell_Darl")
+    record.date_published = date(1991, 1, 10)
+    db.add_record(record)
+    output_path = tmp_path / "obituaries.csv"
+
+    db.export_to_csv(str(output_path))
+
+    with open(output_path, newline="", encoding="utf-8") as csvfile:
+        rows = list(csv.DictReader(csvfile))
+    assert len(rows) == 1
+    assert rows[0]["date_published"] == "January 10, 1991"
+    assert "image" not in rows[0]
+
+
+@pytest.mark.parametrize(
+    "filename, expected",
+    [
+        (
+            "19910110_Alt_Russell_Darl",
+            ("1991", "01", "10", date(1991, 1, 10), "Alt, Russell Darl"),
+        ),
+        ("19911310_Alt_Russell", ("1991", "13", "10", None, "Alt, Russell")),
+        ("1991011_Alt_Russell", (None, None, None, None, None)),
+        ("19910110Alt_Russell", (None, None, None, None, None)),
+    ],
+)
+def test_from_image_path_parses_filename(filename: str, expected: tuple):
+    record = ObituaryRecord.from_image_path(
+        f"obituaries/1991/{filename}.jpg", "text", Image.new("L", (4, 4))
+    )
+
+    assert (
+        record.year,
+        record.month,
+        record.day,
+        record.date_published,
+        record.name,
+    ) == expected
+
+
+def test_add_column_if_not_exists_updates_cached_schema(db: ObituaryDatabase):
+    assert "notes" not in db.get_columns("obituaries")
+
+    db.add_column_if_not_exists("obituaries", "notes", "TEXT")
+
+    assert "notes" in db.get_columns("obituaries")
+    table_info = db.conn.execute("PRAGMA table_info(obituaries)").fetchall()
+    assert "notes" in {info[1] for info in table_info}
+
+
+def test_populate_date_published_skips_invalid_dates(db: ObituaryDatabase):
+    for day in ("10", "31"):
+        record = make_record(f"199102{day}_Name")
+        record.year, record.month, record.day = "1991", "02", day
+        db.add_record(record)
+
+    db.populate_date_published()
+
+    assert [r.date_published for r in db.get_all_records()] == [
+        date(1991, 2, 10),
+        None,
+    ]
+
+
+def test_export_to_excel_writes_header_and_rows(db: ObituaryDatabase, tmp_path: Path):
+    openpyxl = pytest.importorskip("openpyxl")
+    db.add_records([make_record("19910110_Name"), make_record("19910111_Name")])
+    output_path = tmp_path / "obituaries.xlsx"
+
+    db.export_to_excel(str(output_path))
+
+    rows = list(openpyxl.load_workbook(output_path).active.iter_rows(values_only=True))
+    assert list(rows[0]) == EXPORT_COLUMNS
+    assert len(rows) == 3
+
+
+def test_from_image_path_shrinks_jpeg_to_thumbnail(tmp_path: Path):
+    image_path = tmp_path / "19910110_Alt_Russell_Darl.jpg"
+    Image.new("L", (4000, 3000)).save(image_path)
+
+    with Image.open(image_path) as raw_image:
+        record = ObituaryRecord.from_image_path(str(image_path), "text", raw_image)
+
+    assert record.image is not None
+    with Image.open(BytesIO(record.image)) as thumbnail:
+        assert thumbnail.format == "JPEG"
+        assert max(thumbnail.size) <= 1024
+
+
+def test_store_transcriptions_adds_batch(tmp_path: Path):
+    db_path = str(tmp_path / "obituaries.db")
+    transcriptions = [
+        (f"1991011{day}_Name.jpg", "text", Image.new("L", (4, 4)), None)
+        for day in range(2)
+    ]
+
+    records = store_transcriptions(transcriptions, db_path=db_path)
+
+    db = ObituaryDatabase(db_path)
+    try:
+        assert len(db.get_all_records()) == len(records) == 2
+    finally:
+        db.close()
+
+
+def test_search_records_matches_word_prefixes(db: ObituaryDatabase):
+    alt = make_record("19910110_Alt_Russell_Darl")
+    alt.text_content = "Russell Alt, a beloved teacher, died at home."
+    brown = make_record("19910111_Brown_James_E")
+    brown.text_content = "James Brown was a nurse in the city."
+    db.add_records([alt, brown])
+
+    assert [r.image_path for r in db.search_records("teach")] == [alt.image_path]
+    assert [r.image_path for r in db.search_records('nurse "city"')] == [
+        brown.image_path
+    ]
+    assert len(db.search_records("")) == 2
+
+
+def test_search_index_is_built_for_existing_rows(tmp_path: Path):
+    db_path = str(tmp_path / "obituaries.db")
+    db = ObituaryDatabase(db_path)
+    db.add_record(make_record("19910110_Alt_Russell_Darl"))
+    db.conn.execute("DROP TABLE obituaries_fts")
+    db.conn.commit()
+    db.close()
+
+    reopened = ObituaryDatabase(db_path)
+    try:
+        assert len(reopened.search_records("obituary")) == 1
+    finally:
+        reopened.close()
+
+
+class NoFts5Cursor(sqlite3.Cursor):
+    """Cursor that behaves like a SQLite build compiled without FTS5."""
+
+    def execute(self, sql: str, *args: Any) -> sqlite3.Cursor:
+        if "USING fts5" in sql:
+            raise sqlite3.OperationalError("no such module: fts5")
+        return super().execute(sql, *args)
+
+
+class NoFts5Connection(sqlite3.Connection):
+    def cursor(self, factory: Any = NoFts5Cursor) -> sqlite3.Cursor:
+        return super().cursor(factory)
+
+
+def test_search_records_without_fts5(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    connect = sqlite3.connect
+    monkeypatch.setattr(
+        "src.database.sqlite3.connect",
+        lambda *args, **kwargs: connect(*args, factory=NoFts5Connection, **kwargs),
+    )
+    db = ObituaryDatabase(str(tmp_path / "obituaries.db"))
+    try:
+        alt = make_record("19910110_Alt_Russell_Darl")
+        db.add_records([alt, make_record("19910111_Brown_James_E")])
+
+        # Falls back to a substring search
+        assert not db.has_search_index
+        assert [r.image_path for r in db.search_records("ussell")] == [alt.image_path]
+    finally:
+        db.close()
+
+
+def test_get_records_by_image_path(db: ObituaryDatabase):
+    records = [make_record(f"1991011{day}_Name") for day in range(2)]
+    db.add_records(records)
+
+    stored = db.get_records_by_image_path()
+
+    assert set(stored) == {r.image_path for r in records}
+    assert stored[records[1].image_path].text_content == records[1].text_content
+
+
+def test_content_hash_round_trips(db: ObituaryDatabase):
+    record = make_record("19910110_Alt_Russell_Darl")
+    record.content_hash = "0123abcd"
+    db.add_record(record)
+
+    stored = db.get_record_by_image_path(record.image_path)
+
+    assert stored is not None
+    assert stored.content_hash == "0123abcd"
@@ -1,45 +1,51 @@
 from pathlib import Path
-from unittest.mock import MagicMock, patch
+from unittest.mock import MagicMock, call, patch
 
 import pytest  # type: ignore
 import requests
 
 from src import config
-from src.downloader import download_image, download_obituary_image
+from src.downloader import (
+    ObituaryScraper,
+    RateLimiter,
+    bulk_download_obituaries,
+    configure_http_client,
+    download_image,
+    download_obituary_image,
+    extract_filename_from_url,
+    fetch_obituary_links,
+    transform_url_to_image_path,
+)
+
+
+OBITUARY_LINK = "display.jsp?name=19910110_Alt_Russell_Darl"
+DISPLAY_URL = f"{config.ARCHIVE_URL}{OBITUARY_LINK}"
+IMAGE_URL_PREFIX = "http://obit.glbthistory.org/olo/imagedb/1991/01/10/19910110_Alt_Russell_Darl/m19910110"
 
 
 @patch("src.downloader.ensure_directory_exists")
 @patch("src.downloader.download_image")
-@patch("builtins.open", new_callable=MagicMock)
+@patch("src.downloader.config.DATA_DIR", Path("/mock/path"))
 def test_download_obituary_image_success(
-    mock_open, mock_download_image, mock_ensure_directory_exists  # type: ignore
+    mock_download_image, mock_ensure_directory_exists  # type: ignore
 ):
-    # Mock configuration
     mock_client = MagicMock(spec=requests.Session)
-    mock_download_image.return_value = b"image_data"
-    mock_ensure_directory_exists.return_value = Path("/mock/path")
-
-    # Mock functions
-    obituary_link = "display.jsp?name=19910110_Alt_Russell_Darl"
-    mock_image_url = "http://obit.glbthistory.org/olo/imagedb/1991/01/10/19910110_Alt_Russell_Darl/m19910110_0.jpg"
+    mock_download_image.return_value = True
 
     with patch(
-        "src.downloader.extract_filename_from_url",
-        return_value="19910110_Alt_Russell_Darl",
-    ):
-        with patch(
-            "src.downloader.transform_url_to_image_path", return_value=mock_image_url
-        ):
-            # Call the function
-            download_obituary_image(obituary_link, mock_client)
-
-    # Assertions
-    mock_ensure_directory_exists.assert_called_once_with(Path("/mock/path/1991"))  # type: ignore
-    mock_download_image.assert_called_once_with(mock_image_url, mock_client)  # type: ignore
-    mock_open.assert_called_once_with(  # type: ignore
-        Path("/mock/path/1991/19910110_Alt_Russell_Darl.jpg"), "wb"
+        "src.downloader.resolve_obituary",
+        return_value=("19910110_Alt_Russell_Darl", IMAGE_URL_PREFIX),
+    ) as mock_resolve_obituary:
+        download_obituary_image(OBITUARY_LINK, mock_client)
+
+    # The link is parsed once, and index 0 succeeding stops the search
+    mock_resolve_obituary.assert_called_once_with(DISPLAY_URL)
+    mock_ensure_directory_exists.assert_not_called()  # type: ignore
+    mock_download_image.assert_called_once_with(  # type: ignore
+        f"{IMAGE_URL_PREFIX}_0.jpg",
+        Path("/mock/path/1991/19910110_Alt_Russell_Darl.jpg"),
+        mock_client,
     )
-    mock_open().write.assert_called_once_with(b"image_data")  # type: ignore
 
 
 @patch("src.downloader.download_image")
@@ -47,110 +53,392 @@ def test_download_obituary_image_invalid_filename(mock_download_image):  # type:
     mock_client = MagicMock(spec=requests.Session)
     obituary_link = "invalid_link"
 
-    with patch("src.downloader.extract_filename_from_url", return_value=None):
+    with patch(
+        "src.downloader.resolve_obituary", return_value=None
+    ) as mock_resolve_obituary:
         with pytest.raises(
             ValueError,
             match="Failed to extract filename from URL: http://obit.glbthistory.org/olo/invalid_link",
         ):
             download_obituary_image(obituary_link, mock_client)
 
+    mock_resolve_obituary.assert_called_once_with(f"{config.ARCHIVE_URL}invalid_link")
     mock_download_image.assert_not_called()  # type: ignore
 
 
-@patch("src.downloader.download_image")
-def test_download_obituary_image_invalid_image_url(mock_download_image):  # type: ignore
+@patch("src.downloader.time.sleep", return_value=None)
+def test_download_obituary_image_invalid_image_url(mock_sleep, tmp_path: Path):  # type: ignore
     mock_client = MagicMock(spec=requests.Session)
-    obituary_link = "display.jsp?name=19910110_Alt_Russell_Darl"
-
-    with patch(
-        "src.downloader.extract_filename_from_url",
-        return_value="19910110_Alt_Russell_Darl",
+    (tmp_path / "1991").mkdir()
+
+    # A prefix that doesn't form an http URL is rejected by download_image
+    # for every index without a request being made
+    with (
+        patch("src.downloader.config.DATA_DIR", tmp_path),
+        patch(
+            "src.downloader.resolve_obituary",
+            return_value=("19910110_Alt_Russell_Darl", "imagedb/m19910110"),
+        ),
     ):
-        with patch("src.downloader.transform_url_to_image_path", return_value=None):
-            with pytest.raises(
-                ValueError,
-                match="Failed to transform URL to image path: http://obit.glbthistory.org/olo/display.jsp?name=19910110_Alt_Russell_Darl",
-            ):
-                download_obituary_image(obituary_link, mock_client)
+        with pytest.raises(
+            ValueError,
+            match="Failed to download obituary image with any index for 19910110_Alt_Russell_Darl",
+        ):
+            download_obituary_image(OBITUARY_LINK, mock_client)
 
-    mock_download_image.assert_not_called()  # type: ignore
+    mock_client.get.assert_not_called()
+    assert list((tmp_path / "1991").iterdir()) == []
 
 
 @patch("src.downloader.download_image")
-def test_download_obituary_image_download_failure(mock_download_image: MagicMock):
+def test_download_obituary_image_download_failure(
+    mock_download_image: MagicMock, tmp_path: Path
+):
     mock_client = MagicMock(spec=requests.Session)
-    obituary_link = "display.jsp?name=19910110_Alt_Russell_Darl"
-    mock_image_url = "http://obit.glbthistory.org/olo/imagedb/1991/01/10/19910110_Alt_Russell_Darl/m19910110_0.jpg"
-
-    mock_download_image.return_value = None
+    mock_download_image.side_effect = requests.HTTPError("404 Not Found")
 
-    with patch(
-        "src.downloader.extract_filename_from_url",
-        return_value="19910110_Alt_Russell_Darl",
-    ):
-        with patch(
-            "src.downloader.transform_url_to_image_path", return_value=mock_image_url
+    with patch("src.downloader.config.DATA_DIR", tmp_path):
+        with pytest.raises(
+            ValueError,
+            match="Failed to download obituary image with any index for 19910110_Alt_Russell_Darl",
         ):
-            with pytest.raises(
-                ValueError,
-                match="Failed to download image from URL: http://obit.glbthistory.org/olo/imagedb/1991/01/10/19910110_Alt_Russell_Darl/m19910110_0.jpg",
-            ):
-                download_obituary_image(obituary_link, mock_client)
-
-
-def test_download_image_success():
+            download_obituary_image(OBITUARY_LINK, mock_client)
+
+    # Index 0 is tried first, then both alternatives
+    year_dir = tmp_path / "1991"
+    assert mock_download_image.call_args_list == [
+        call(
+            f"{IMAGE_URL_PREFIX}_0.jpg",
+            year_dir / "19910110_Alt_Russell_Darl.jpg",
+            mock_client,
+        ),
+        call(
+            f"{IMAGE_URL_PREFIX}_1.jpg",
+            year_dir / "19910110_Alt_Russell_Darl_1.jpg",
+            mock_client,
+        ),
+        call(
+            f"{IMAGE_URL_PREFIX}_2.jpg",
+            year_dir / "19910110_Alt_Russell_Darl_2.jpg",
+            mock_client,
+        ),
+    ]
+
+
+def mock_streaming_client(mock_response: MagicMock) -> MagicMock:
+    """Build a mock session whose `get` returns `mock_response` as a context manager."""
     mock_client = MagicMock(spec=requests.Session)
-    mock_response = MagicMock()
-    mock_response.content = b"image_data"
-    mock_response.raise_for_status = MagicMock()
+    mock_response.__enter__.return_value = mock_response
     mock_client.get.return_value = mock_response
+    return mock_client
 
-    # Add import for config
-    from src import config
+
+@patch("src.downloader.time.sleep", return_value=None)
+def test_download_image_success(mock_sleep, tmp_path: Path):  # type: ignore
+    mock_response = MagicMock()
+    mock_response.iter_content.return_value = [b"image_", b"data"]
+    mock_client = mock_streaming_client(mock_response)
 
     image_url = "http://example.com/image.jpg"
-    result = download_image(image_url, mock_client)
+    file_path = tmp_path / "image.jpg"
+    result = download_image(image_url, file_path, mock_client)
 
-    mock_client.get.assert_called_once_with(image_url, timeout=config.REQUEST_TIMEOUT)
+    mock_client.get.assert_called_once_with(
+        image_url, stream=True, timeout=config.REQUEST_TIMEOUT
+    )
     mock_response.raise_for_status.assert_called_once()
-    assert result == b"image_data"
+    assert result is True
+    assert file_path.read_bytes() == b"image_data"
 
 
 @patch("src.downloader.time.sleep", return_value=None)
-def test_download_image_invalid_url(mock_sleep: MagicMock):
+def test_download_image_invalid_url(mock_sleep: MagicMock, tmp_path: Path):
     mock_client = MagicMock(spec=requests.Session)
     image_url = "invalid_url"
 
-    result = download_image(image_url, mock_client)
+    result = download_image(image_url, tmp_path / "image.jpg", mock_client)
 
     mock_client.get.assert_not_called()
-    assert result is None
+    assert result is False
 
 
 @patch("src.downloader.time.sleep", return_value=None)
-def test_download_image_request_exception(mock_sleep):  # type: ignore
+def test_download_image_request_exception(mock_sleep, tmp_path: Path):  # type: ignore
     mock_client = MagicMock(spec=requests.Session)
     mock_client.get.side_effect = requests.RequestException("Request failed")
 
     image_url = "http://example.com/image.jpg"
 
     with pytest.raises(requests.RequestException, match="Request failed"):
-        download_image(image_url, mock_client)
+        download_image(image_url, tmp_path / "image.jpg", mock_client)
 
-    mock_client.get.assert_called_once_with(image_url, timeout=config.REQUEST_TIMEOUT)
+    mock_client.get.assert_called_once_with(
+        image_url, stream=True, timeout=config.REQUEST_TIMEOUT
+    )
 
 
 @patch("src.downloader.time.sleep", return_value=None)
-def test_download_image_http_error(mock_sleep):  # type: ignore
-    mock_client = MagicMock(spec=requests.Session)
+def test_download_image_http_error(mock_sleep, tmp_path: Path):  # type: ignore
     mock_response = MagicMock()
     mock_response.raise_for_status.side_effect = requests.HTTPError("HTTP error")
-    mock_client.get.return_value = mock_response
+    mock_client = mock_streaming_client(mock_response)
 
     image_url = "http://example.com/image.jpg"
 
     with pytest.raises(requests.HTTPError, match="HTTP error"):
-        download_image(image_url, mock_client)
+        download_image(image_url, tmp_path / "image.jpg", mock_client)
 
-    mock_client.get.assert_called_once_with(image_url, timeout=config.REQUEST_TIMEOUT)
+    mock_client.get.assert_called_once_with(
+        image_url, stream=True, timeout=config.REQUEST_TIMEOUT
+    )
     mock_response.raise_for_status.assert_called_once()
+
+
+@patch("src.downloader.time.sleep", return_value=None)
+def test_download_image_removes_partial_file(mock_sleep, tmp_path: Path):  # type: ignore
+    mock_response = MagicMock()
+    mock_response.iter_content.side_effect = requests.ConnectionError("Reset")
+    mock_client = mock_streaming_client(mock_response)
+
+    file_path = tmp_path / "image.jpg"
+
+    with pytest.raises(requests.ConnectionError, match="Reset"):
+        download_image("http://example.com/image.jpg", file_path, mock_client)
+
+    assert not file_path.exists()
+
+
+@patch("src.downloader.time.sleep", return_value=None)
+def test_download_obituary_image_retries_after_interrupted_download(
+    mock_sleep, tmp_path: Path  # type: ignore
+):
+    def interrupted_stream(chunk_size: int):
+        yield b"half_an_"
+        raise KeyboardInterrupt
+
+    interrupted_response = MagicMock()
+    interrupted_response.iter_content.side_effect = interrupted_stream
+    mock_client = mock_streaming_client(interrupted_response)
+    obituary_link = "display.jsp?name=19910110_Alt_Russell_Darl"
+    (tmp_path / "1991").mkdir()
+    file_path = tmp_path / "1991" / "19910110_Alt_Russell_Darl.jpg"
+
+    with patch("src.downloader.config.DATA_DIR", tmp_path):
+        with pytest.raises(KeyboardInterrupt):
+            download_obituary_image(obituary_link, mock_client)
+
+        # Nothing truncated is left behind for the next run to skip
+        assert list((tmp_path / "1991").iterdir()) == []
+
+        complete_response = MagicMock()
+        complete_response.iter_content.return_value = [b"whole_image"]
+        mock_client = mock_streaming_client(complete_response)
+        download_obituary_image(obituary_link, mock_client)
+
+    assert file_path.read_bytes() == b"whole_image"
+
+
+@patch("src.downloader.download_obituary_image")
+@patch("src.downloader.ensure_directory_exists")
+def test_bulk_download_obituaries_downloads_every_link(
+    mock_ensure_directory_exists, mock_download_obituary_image  # type: ignore
+):
+    obituary_links = [
+        "display.jsp?name=19910110_Alt_Russell_Darl",
+        "display.jsp?name=19910111_Brown_James_E",
+    ]
+    mock_download_obituary_image.side_effect = [None, ValueError("boom")]
+
+    bulk_download_obituaries(obituary_links)
+
+    called_links = sorted(
+        call.args[0] for call in mock_download_obituary_image.call_args_list  # type: ignore
+    )
+    assert called_links == sorted(obituary_links)
+    clients = {call.args[1] for call in mock_download_obituary_image.call_args_list}  # type: ignore
+    assert len(clients) == 1  # A single session is shared by all downloads
+    created = {call.args[0] for call in mock_ensure_directory_exists.call_args_list}  # type: ignore
+    assert created == {config.DATA_DIR, config.DATA_DIR / "1991"}
+
+
+@patch("src.downloader.as_completed", side_effect=KeyboardInterrupt)
+@patch("src.downloader.ThreadPoolExecutor")
+@patch("src.downloader.ensure_directory_exists")
+def test_bulk_download_obituaries_cancels_queued_downloads_on_interrupt(
+    mock_ensure_directory_exists, mock_executor_cls, mock_as_completed  # type: ignore
+):
+    with pytest.raises(KeyboardInterrupt):
+        bulk_download_obituaries(["display.jsp?name=19910110_Alt_Russell_Darl"])
+
+    mock_executor_cls.return_value.shutdown.assert_called_once_with(  # type: ignore
+        cancel_futures=True
+    )
+
+
+@patch("src.downloader.download_image")
+def test_download_obituary_image_skips_existing_file(
+    mock_download_image, tmp_path: Path  # type: ignore
+):
+    mock_client = MagicMock(spec=requests.Session)
+    (tmp_path / "1991").mkdir()
+    (tmp_path / "1991" / "19910110_Alt_Russell_Darl_1.jpg").write_bytes(b"image")
+
+    with patch("src.downloader.config.DATA_DIR", tmp_path):
+        download_obituary_image(
+            "display.jsp?name=19910110_Alt_Russell_Darl", mock_client
+        )
+
+    mock_download_image.assert_not_called()  # type: ignore
+
+
+SEARCH_PAGE = """
+<form action="search.jsp" method="post">
+  <select name="yearfrom"><option value="1991">1991</option><option value="1992">1992</option></select>
+  <select name="monthfrom"><option value="1" selected>January</option></select>
+  <select name="yearto"><option value="1991">1991</option></select>
+  <select name="monthto"><option value="1">January</option></select>
+  <input type="hidden" name="mode" value="range">
+  <input type="submit" name="search" value="Search">
+</form>
+"""
+
+RESULTS_PAGE = """
+<a href="index.jsp">Back</a>
+<a href="display.jsp?name=19910110_Alt_Russell_Darl">Alt, Russell Darl</a>
+<a href="display.jsp?name=19910111_Brown_James_E">Brown, James E</a>
+"""
+
+
+def test_fetch_obituary_links_submits_search_form():
+    mock_client = MagicMock(spec=requests.Session)
+    mock_client.get.return_value = MagicMock(
+        text=SEARCH_PAGE, url="http://obit.glbthistory.org/olo/index.jsp"
+    )
+    mock_client.post.return_value = MagicMock(text=RESULTS_PAGE)
+
+    links = fetch_obituary_links(mock_client, "1991", "1992")
+
+    assert links == [
+        "display.jsp?name=19910110_Alt_Russell_Darl",
+        "display.jsp?name=19910111_Brown_James_E",
+    ]
+    mock_client.post.assert_called_once_with(
+        "http://obit.glbthistory.org/olo/search.jsp",
+        data={
+            "yearfrom": "1991",
+            "monthfrom": "1",
+            "yearto": "1992",
+            "monthto": "12",
+            "mode": "range",
+            "search": "Search",
+        },
+        timeout=config.REQUEST_TIMEOUT,
+    )
+
+
+def test_fetch_obituary_links_missing_form():
+    mock_client = MagicMock(spec=requests.Session)
+    mock_client.get.return_value = MagicMock(
+        text="<html></html>", url=config.SEARCH_URL
+    )
+
+    with pytest.raises(ValueError, match="Failed to find the search form"):
+        fetch_obituary_links(mock_client, "1991", "1992")
+
+
+def test_obituary_scraper_reuses_browser_across_searches():
+    playwright = MagicMock()
+    browser = playwright.chromium.launch.return_value
+    context = browser.new_context.return_value
+    page = context.new_page.return_value
+    page.eval_on_selector_all.return_value = [
+        "display.jsp?name=19910110_Alt_Russell_Darl",
+        "index.jsp",
+    ]
+
+    with ObituaryScraper(playwright) as scraper:
+        first = scraper.scrape("1991", "1991")
+        second = scraper.scrape("1992", "1992")
+
+    assert first == second == ["display.jsp?name=19910110_Alt_Russell_Darl"]
+    playwright.chromium.launch.assert_called_once_with(headless=True)
+    assert context.new_page.call_count == 2
+    assert page.close.call_count == 2
+    context.close.assert_called_once()
+    browser.close.assert_called_once()
+    # A Playwright instance passed in is left running for its owner
+    playwright.stop.assert_not_called()
+
+
+def test_obituary_scraper_requires_context_manager():
+    with pytest.raises(RuntimeError):
+        ObituaryScraper(MagicMock()).scrape("1991", "1991")
+
+
+@pytest.mark.parametrize(
+    "obituary_url, expected",
+    [
+        (
+            "http://obit.glbthistory.org/olo/display.jsp?name=19910110_Alt_Russell_Darl",
+            "19910110_Alt_Russell_Darl",
+        ),
+        (
+            "http://obit.glbthistory.org/olo/display.jsp?page=2&name=19910110_O%27Brien_Pat",
+            "19910110_O'Brien_Pat",
+        ),
+        ("http://obit.glbthistory.org/olo/invalid_link", None),
+    ],
+)
+def test_extract_filename_from_url(obituary_url: str, expected: str | None):
+    assert extract_filename_from_url(obituary_url) == expected
+
+
+def test_transform_url_to_image_path():
+    display_url = (
+        "http://obit.glbthistory.org/olo/display.jsp?name=19910110_Alt_Russell_Darl"
+    )
+
+    assert transform_url_to_image_path(display_url, 2) == (
+        "http://obit.glbthistory.org/olo/imagedb/1991/01/10/"
+        "19910110_Alt_Russell_Darl/m19910110_2.jpg"
+    )
+
+
+@pytest.mark.parametrize(
+    "display_url",
+    [
+        "http://obit.glbthistory.org/olo/display.jsp?name=1991",
+        "http://obit.glbthistory.org/display.jsp?name=19910110_Alt_Russell_Darl",
+        "ftp://obit.glbthistory.org/olo/display.jsp?name=19910110_Alt_Russell_Darl",
+    ],
+)
+def test_transform_url_to_image_path_invalid(display_url: str):
+    assert transform_url_to_image_path(display_url) is None
+
+
+def test_rate_limiter_waits_for_window():
+    clock = [100.0]
+
+    def fake_sleep(seconds: float) -> None:
+        clock[0] += seconds
+
+    with (
+        patch("src.downloader.time.monotonic", side_effect=lambda: clock[0]),
+        patch("src.downloader.time.sleep", side_effect=fake_sleep) as mock_sleep,
+    ):
+        limiter = RateLimiter(rate=2, per=1.0)
+        for _ in range(3):
+            limiter.acquire()
+
+    mock_sleep.assert_called_once_with(1.0)
+    assert clock[0] == 101.0
+
+
+def test_configure_http_client_retries_transient_errors():
+    with requests.Session() as client:
+        configure_http_client(client)
+        retry = client.get_adapter("http://obit.glbthistory.org").max_retries
+
+    assert retry.total == config.HTTP_RETRIES
+    assert 503 in retry.status_forcelist
+    assert 404 not in retry.status_forcelist
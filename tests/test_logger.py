@@ -0,0 +1,78 @@
+from concurrent.futures import ProcessPoolExecutor
+import logging
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from src.logger import init_worker_logging, setup_logger, start_worker_log_listener
+
+
+def test_setup_logger_does_not_duplicate_handlers(tmp_path: Path):
+    with patch("src.logger.LOG_DIR", tmp_path / "logs"):
+        logger = setup_logger("test_setup_logger")
+        handlers = list(logger.handlers)
+
+        assert setup_logger("test_setup_logger") is logger
+    try:
+        assert logger.handlers == handlers
+        assert logger.propagate is False
+        assert (tmp_path / "logs" / "test_setup_logger.log").exists()
+    finally:
+        # Close the log file and let another test set the logger up afresh
+        for handler in handlers:
+            logger.removeHandler(handler)
+            handler.close()
+
+
+def test_setup_logger_records_reach_caplog_through_its_handler(
+    tmp_path: Path, caplog: pytest.LogCaptureFixture
+):
+    # Loggers don't propagate to the root logger, where caplog listens, so
+    # tests that check log output attach caplog's handler directly
+    with patch("src.logger.LOG_DIR", tmp_path):
+        logger = setup_logger("test_setup_logger_caplog")
+    logger.addHandler(caplog.handler)
+    try:
+        logger.warning("Failed to download")
+    finally:
+        for handler in list(logger.handlers):
+            logger.removeHandler(handler)
+            if handler is not caplog.handler:
+                handler.close()
+
+    assert [record.getMessage() for record in caplog.records] == ["Failed to download"]
+    assert caplog.records[0].levelno == logging.WARNING
+
+
+def test_setup_logger_opens_no_log_file_in_worker_processes(tmp_path: Path):
+    with (
+        patch("src.logger.LOG_DIR", tmp_path),
+        patch("src.logger.multiprocessing.parent_process", return_value=object()),
+    ):
+        logger = setup_logger("test_setup_logger_worker")
+
+    assert logger.handlers == []
+    assert not (tmp_path / "test_setup_logger_worker.log").exists()
+
+
+def test_worker_records_are_written_by_the_main_process(tmp_path: Path):
+    with patch("src.logger.LOG_DIR", tmp_path):
+        logger = setup_logger("test_worker_logging")
+    handlers = list(logger.handlers)
+    queue, listener = start_worker_log_listener("test_worker_logging")
+    try:
+        with ProcessPoolExecutor(
+            max_workers=1,
+            initializer=init_worker_logging,
+            initargs=(queue, "test_worker_logging"),
+        ) as executor:
+            executor.submit(logger.warning, "From a worker").result()
+    finally:
+        listener.stop()
+        for handler in handlers:
+            logger.removeHandler(handler)
+            handler.close()
+
+    log_text = (tmp_path / "test_worker_logging.log").read_text()
+    assert "WARNING - From a worker" in log_text
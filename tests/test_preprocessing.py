@@ -3,42 +3,37 @@ from typing import Any
 
 import cv2
 import numpy as np
-from numpy._core.multiarray import _Array
+import numpy.typing as npt
 import pytest
 
 import src.config as config
-from src.preprocessing import denoise, preprocess_image, scale_up_image
+from src.preprocessing import binarize, denoise, preprocess_image, scale_up_image
 
 
-@pytest.fixture
-def valid_image_path(tmp_path: Path):
-    """Fixture to create a valid image file for testing."""
-    image_path = tmp_path / "test_image.jpg"
-    # Create a simple black image
+@pytest.fixture(scope="session")
+def image_corpus(tmp_path_factory: pytest.TempPathFactory):
+    """Fixture to write the image files used by the tests once per session."""
+    corpus = tmp_path_factory.mktemp("images")
+    # A simple black image
     black_image = np.zeros((100, 100, 3), dtype=np.uint8)
-    cv2.imwrite(str(image_path), black_image)  # type: ignore
-    return image_path
-
-
-@pytest.fixture
-def empty_image_path(tmp_path: Path):
-    """Fixture to create an empty image file."""
-    empty_path = tmp_path / "empty_image.jpg"
-    empty_path.touch()  # Create an empty file
-    return empty_path
+    _, encoded = cv2.imencode(".jpg", black_image)
+    (corpus / "test_image.jpg").write_bytes(encoded.tobytes())
+    (corpus / "empty_image.jpg").touch()
+    (corpus / "corrupted_image.jpg").write_bytes(b"not an image")
+    (corpus / "test.txt").write_text("This is a text file.")
+    return corpus
 
 
 @pytest.fixture
-def corrupted_image_path(tmp_path: Path):
-    """Fixture to create a corrupted image file."""
-    corrupted_path = tmp_path / "corrupted_image.jpg"
-    with open(corrupted_path, "wb") as f:
-        f.write(b"not an image")
-    return corrupted_path
+def valid_image_path(image_corpus: Path):
+    """Fixture to get a valid image file for testing."""
+    return image_corpus / "test_image.jpg"
 
 
-def test_preprocess_image_valid(valid_image_path: Any):
+def test_preprocess_image_valid(valid_image_path: Any, monkeypatch: pytest.MonkeyPatch):
     """Test preprocess_image with a valid image."""
+    # Keep the image at its original size, whatever the configured default
+    monkeypatch.setattr(config, "SCALE_FACTOR", 1)
     processed_image = preprocess_image(valid_image_path)
     assert processed_image is not None
     assert isinstance(processed_image, np.ndarray)
@@ -52,98 +47,126 @@ def test_preprocess_image_file_not_found():
         preprocess_image(non_existent_path)
 
 
-def test_preprocess_image_unsupported_file_type(tmp_path: Path):
+def test_preprocess_image_unsupported_file_type(image_corpus: Path):
     """Test preprocess_image with an unsupported file type."""
-    unsupported_path = tmp_path / "test.txt"
-    unsupported_path.write_text("This is a text file.")
     with pytest.raises(ValueError, match="Unsupported file type"):
-        preprocess_image(unsupported_path)
+        preprocess_image(image_corpus / "test.txt")
 
 
-def test_preprocess_image_empty_file(empty_image_path: Any):
-    """Test preprocess_image with an empty file."""
-    with pytest.raises(ValueError, match="File is empty"):
-        preprocess_image(empty_image_path)
+@pytest.mark.parametrize(
+    "filename, message",
+    [
+        ("empty_image.jpg", "File is empty"),
+        ("corrupted_image.jpg", "File is corrupted"),
+    ],
+    ids=["empty", "corrupted"],
+)
+def test_preprocess_image_invalid_file(image_corpus: Path, filename: str, message: str):
+    """Test preprocess_image with an empty or corrupted image file."""
+    with pytest.raises(ValueError, match=message):
+        preprocess_image(image_corpus / filename)
 
 
-def test_preprocess_image_corrupted_file(corrupted_image_path: Any):
-    """Test preprocess_image with a corrupted image file."""
-    with pytest.raises(ValueError, match="File is corrupted"):
-        preprocess_image(corrupted_image_path)
+def test_preprocess_image_unreadable_file(
+    valid_image_path: Path, monkeypatch: pytest.MonkeyPatch
+):
+    """Test preprocess_image with an image file that can't be read."""
 
+    def deny_read(*args: Any, **kwargs: Any):
+        raise PermissionError("Permission denied")
 
-@pytest.fixture
-def sample_image():
-    """Fixture to create a sample image for testing."""
-    return np.zeros((50, 50, 3), dtype=np.uint8)  # A simple black image
+    monkeypatch.setattr(np, "fromfile", deny_read)
+    with pytest.raises(ValueError, match="File is unreadable"):
+        preprocess_image(valid_image_path)
 
 
-def test_scale_up_image_valid(sample_image: _Array[tuple[int, int, int], np.unsignedinteger[np._8Bit]]):
-    """Test scale_up_image with a valid image."""
-    config.SCALE_FACTOR = 2  # Set scale factor for testing
+@pytest.fixture(scope="session")
+def sample_image():
+    """Fixture to create a sample image for testing, shared by all tests."""
+    image = np.zeros((50, 50, 3), dtype=np.uint8)  # A simple black image
+    # Read-only, so a test cannot change the image seen by later tests
+    image.setflags(write=False)
+    return image
+
+
+@pytest.mark.parametrize(
+    "scale_factor, expected_shape",
+    [
+        (2, (100, 100)),
+        (0.5, (25, 25)),  # Fractional scale factors shrink the image
+    ],
+)
+def test_scale_up_image_valid(
+    sample_image: npt.NDArray[np.uint8],
+    monkeypatch: pytest.MonkeyPatch,
+    scale_factor: float,
+    expected_shape: tuple[int, int],
+):
+    """Test scale_up_image with valid scale factors."""
+    monkeypatch.setattr(config, "SCALE_FACTOR", scale_factor)
     scaled_image = scale_up_image(sample_image)
-    assert scaled_image is not None
     assert isinstance(scaled_image, np.ndarray)
-    assert scaled_image.shape[:2] == (100, 100)  # Check dimensions after scaling
-
-
-def test_scale_up_image_invalid_input():
-    """Test scale_up_image with invalid input."""
-    with pytest.raises(AttributeError):
-        scale_up_image(None)  # Passing None should raise an error
+    assert scaled_image.shape[:2] == expected_shape  # Check dimensions after scaling
 
 
-def test_scale_up_image_zero_scale_factor(
-    sample_image: _Array[tuple[int, int, int], np.unsignedinteger[np._8Bit]],
+@pytest.mark.parametrize("scale_factor", [0, -1])
+def test_scale_up_image_invalid_scale_factor(
+    sample_image: npt.NDArray[np.uint8],
+    monkeypatch: pytest.MonkeyPatch,
+    scale_factor: float,
 ):
-    """Test scale_up_image with a zero scale factor."""
-    config.SCALE_FACTOR = 0  # Set scale factor to zero
+    """Test scale_up_image with a zero or negative scale factor."""
+    monkeypatch.setattr(config, "SCALE_FACTOR", scale_factor)
     with pytest.raises(cv2.error):
         scale_up_image(sample_image)
 
 
-def test_scale_up_image_negative_scale_factor(
-    sample_image: _Array[tuple[int, int, int], np.uint8],
-):
-    """Test scale_up_image with a negative scale factor."""
-    config.SCALE_FACTOR = -1  # Set scale factor to negative
-    with pytest.raises(cv2.error):
-        scale_up_image(sample_image)
+def test_scale_up_image_invalid_input():
+    """Test scale_up_image with invalid input."""
+    with pytest.raises(AttributeError):
+        scale_up_image(None)  # Passing None should raise an error
 
 
-def test_denoise_valid_image(sample_image: _Array[tuple[int, int, int], np.unsignedinteger[np._8Bit]]):
-    """Test denoise with a valid image."""
-    config.GAUSSIAN_KERNEL_SIZE = (5, 5)  # Set kernel size for testing
-    config.CLAHE_TILE_SIZE = (8, 8)  # Set CLAHE tile size for testing
-    denoised_image = denoise(sample_image)
-    assert denoised_image is not None
+@pytest.mark.parametrize(
+    "image",
+    [
+        np.zeros((50, 50, 3), dtype=np.uint8),  # BGR image
+        np.zeros((50, 50), dtype=np.uint8),  # Grayscale image
+    ],
+    ids=["bgr", "grayscale"],
+)
+def test_denoise_valid_image(
+    monkeypatch: pytest.MonkeyPatch, image: npt.NDArray[np.uint8]
+):
+    """Test denoise with valid color and grayscale images."""
+    monkeypatch.setattr(config, "CLAHE_TILE_SIZE", (8, 8))
+    denoised_image = denoise(image)
     assert isinstance(denoised_image, np.ndarray)
-    assert (
-        denoised_image.shape[:2] == sample_image.shape[:2]
-    )  # Dimensions should remain the same
-
-
-def test_denoise_invalid_input():
+    # Dimensions should remain the same, as a single channel
+    assert denoised_image.shape == image.shape[:2]
+
+
+@pytest.mark.parametrize(
+    "image",
+    [
+        None,
+        np.zeros((0, 0, 3), dtype=np.uint8),  # Empty image
+    ],
+    ids=["none", "empty"],
+)
+def test_denoise_invalid_input(image: npt.NDArray[np.uint8] | None):
     """Test denoise with invalid input."""
     with pytest.raises(cv2.error):
-        denoise(None)  # Passing None should raise an error
+        denoise(image)
 
 
-def test_denoise_empty_image():
-    """Test denoise with an empty image."""
-    empty_image = np.zeros((0, 0, 3), dtype=np.uint8)  # Empty image
-    with pytest.raises(cv2.error):
-        denoise(empty_image)
-
-
-def test_denoise_grayscale_image():
-    """Test denoise with a grayscale image."""
-    config.GAUSSIAN_KERNEL_SIZE = (5, 5)  # Set kernel size for testing
-    config.CLAHE_TILE_SIZE = (8, 8)  # Set CLAHE tile size for testing
-    grayscale_image = np.zeros((50, 50), dtype=np.uint8)  # Grayscale image
-    denoised_image = denoise(grayscale_image)
-    assert denoised_image is not None
-    assert isinstance(denoised_image, np.ndarray)
-    assert (
-        denoised_image.shape == grayscale_image.shape
-    )  # Dimensions should remain the same
+@pytest.mark.parametrize("use_adaptive_threshold", [True, False])
+def test_binarize_produces_binary_image(
+    monkeypatch: pytest.MonkeyPatch, use_adaptive_threshold: bool
+):
+    """Test binarize with both thresholding methods."""
+    monkeypatch.setattr(config, "USE_ADAPTIVE_THRESHOLD", use_adaptive_threshold)
+    gradient = np.tile(np.arange(256, dtype=np.uint8), (64, 1))
+    binary_image = binarize(gradient)
+    assert binary_image.shape == gradient.shape
+    assert set(np.unique(binary_image)) <= {0, 255}
@@ -0,0 +1,60 @@
+import pytest
+
+from src.textnormalizer import TextNormalizer
+
+
+@pytest.fixture
+def normalizer():
+    return TextNormalizer()
+
+
+@pytest.mark.parametrize(
+    "text, expected",
+    [
+        ("c4t", "cat"),
+        ("he1p", "help"),
+        ("b0ok", "book"),
+        ("ca5e", "case"),
+        ("Born in '6o, died in '9o.", "Born in '60, died in '90."),
+        ("1991 and 4 ways", "1991 and 4 ways"),  # Digits not between letters
+        ("a4b1c", "aablc"),  # Adjacent corrections are all applied
+    ],
+)
+def test_fix_ocr_errors(normalizer: TextNormalizer, text: str, expected: str):
+    assert normalizer.fix_ocr_errors(text) == expected
+
+
+def test_clean_text_empty(normalizer: TextNormalizer):
+    assert normalizer.clean_text("") == ""
+
+
+def test_clean_text(normalizer: TextNormalizer):
+    text = '  He  was §born in \'5o\r\nin Ch1cago.  \rHe w0rked as a mem-\n ber of "staff".'
+    expected = "He was born in '5o\nin Chlcago.\nHe worked as a member of 'staff'."
+    assert normalizer.clean_text(text) == expected
+
+
+def test_fix_ocr_errors_skips_text_without_digits(normalizer: TextNormalizer):
+    text = "He was born in Chicago."
+    assert normalizer.fix_ocr_errors(text) is text
+
+
+def test_normalize_whitespace(normalizer: TextNormalizer):
+    text = '  He   said  "hi"  \n\n  to´   them  '
+    assert normalizer.normalize_whitespace(text) == "He said 'hi'\n\nto' them"
+
+
+def test_clean_text_keeps_quotes(normalizer: TextNormalizer):
+    text = 'He  said "hi" to´ §them.'
+    assert (
+        normalizer.clean_text(text, normalize_quotes=False) == 'He said "hi" to´ them.'
+    )
+
+
+def test_normalize_whitespace_collapses_tabs(normalizer: TextNormalizer):
+    assert normalizer.normalize_whitespace("\tHe \t was born ") == "He was born"
+
+
+def test_clean_text_joins_consecutive_hyphenations(normalizer: TextNormalizer):
+    text = "He was a mem-\nber of the com- \n\n mit-\ntee."
+    assert normalizer.clean_text(text) == "He was a member of the committee."
@@ -2,16 +2,19 @@ from pathlib import Path
 import tempfile
 from unittest.mock import MagicMock, patch
 
-from PIL import UnidentifiedImageError
+import numpy as np
+from PIL import Image, UnidentifiedImageError
 import pytest
 
-from src.transcriber import transcribe_images
+from src.database import ObituaryRecord
+from src.transcriber import file_content_hash, transcribe_images
 
 
 @pytest.fixture
 def mock_preprocess_image():
     with patch("src.transcriber.preprocess_image") as mock:
-        mock.return_value = MagicMock()
+        # A real array, so Image.fromarray accepts it as preprocessed output
+        mock.return_value = np.zeros((1, 1), dtype=np.uint8)
         yield mock
 
 
@@ -23,8 +26,8 @@ def mock_pytesseract():
 
 
 @pytest.fixture
-def mock_clean_irregular_text():
-    with patch("src.transcriber.clean_irregular_text") as mock:
+def mock_clean_text():
+    with patch("src.transcriber.normalizer.clean_text") as mock:
         mock.side_effect = lambda text: text
         yield mock
 
@@ -45,59 +48,150 @@ def temp_image_directory():
         yield temp_path
 
 
-def test_transcribe_images_without_spellcheck(
+@pytest.mark.parametrize(
+    "spellcheck, open_error",
+    [
+        (False, None),
+        (True, None),
+        (False, UnidentifiedImageError),
+    ],
+    ids=["without_spellcheck", "with_spellcheck", "unidentified_image_error"],
+)
+def test_transcribe_images(
     temp_image_directory,
     mock_preprocess_image,
     mock_pytesseract,
-    mock_clean_irregular_text,
+    mock_clean_text,
+    mock_autocorrect_text,
+    spellcheck,
+    open_error,
 ):
+    with patch("PIL.Image.open") as mock_image_open:
+        mock_image_open.side_effect = open_error
+        mock_image_open.return_value.__enter__.return_value = MagicMock()
+
+        records = transcribe_images(
+            temp_image_directory,
+            spellcheck=spellcheck,
+            db_path=str(temp_image_directory / "obituaries.db"),
+        )
+
+    mock_preprocess_image.assert_called_once()
+    # The preprocessed image is handed to Tesseract without a temporary file
+    written = {
+        path.name
+        for path in temp_image_directory.iterdir()
+        if not path.name.startswith("obituaries.db")
+    }
+    assert written == {"test_image.jpg"}
+    if open_error:
+        mock_pytesseract.assert_not_called()
+        assert records == []
+    else:
+        mock_pytesseract.assert_called_once()
+        mock_clean_text.assert_called_once()
+        assert len(records) == 1
+    assert mock_autocorrect_text.called == (spellcheck and not open_error)
+
+
+def test_transcribe_images_stores_records(temp_image_directory):
+    record = MagicMock()
     with (
-        patch("cv2.imwrite") as mock_cv2_imwrite,
-        patch("PIL.Image.open") as mock_image_open,
+        patch(
+            "src.transcriber.transcribe_image", return_value=record
+        ) as mock_transcribe,
+        patch("src.transcriber.ObituaryDatabase") as mock_database,
     ):
-        mock_image_open.return_value.__enter__.return_value = MagicMock()
+        mock_database.return_value.get_records_by_image_path.return_value = {}
 
-        transcribe_images(temp_image_directory, spellcheck=False)
+        records = transcribe_images(temp_image_directory, spellcheck=True, workers=1)
 
-        mock_preprocess_image.assert_called_once()
-        mock_pytesseract.assert_called_once()
-        mock_clean_irregular_text.assert_called_once()
-        mock_cv2_imwrite.assert_called_once()
+    mock_transcribe.assert_called_once_with(
+        temp_image_directory / "test_image.jpg", spellcheck=True
+    )
+    mock_database.return_value.add_records.assert_called_once_with([record])
+    mock_database.return_value.close.assert_called_once()
+    assert records == [record]
 
 
-def test_transcribe_images_with_spellcheck(
-    temp_image_directory,
-    mock_preprocess_image,
-    mock_pytesseract,
-    mock_clean_irregular_text,
-    mock_autocorrect_text,
-):
+def test_transcribe_images_skips_stored_images(temp_image_directory):
+    record = MagicMock()
     with (
-        patch("cv2.imwrite") as mock_cv2_imwrite,
-        patch("PIL.Image.open") as mock_image_open,
+        patch("src.transcriber.transcribe_image") as mock_transcribe,
+        patch("src.transcriber.ObituaryDatabase") as mock_database,
     ):
-        mock_image_open.return_value.__enter__.return_value = MagicMock()
+        mock_database.return_value.get_records_by_image_path.return_value = {
+            "test_image.jpg": record
+        }
 
-        transcribe_images(temp_image_directory, spellcheck=True)
+        records = transcribe_images(temp_image_directory, workers=1)
 
-        mock_preprocess_image.assert_called_once()
-        mock_pytesseract.assert_called_once()
-        mock_clean_irregular_text.assert_called_once()
-        mock_autocorrect_text.assert_called_once()
-        mock_cv2_imwrite.assert_called_once()
+    mock_transcribe.assert_not_called()
+    assert records == [record]
 
 
-def test_transcribe_images_handles_unidentified_image_error(
+def test_transcribe_images_copies_renamed_stored_images(tmp_path: Path):
+    file = tmp_path / "19910110_Alt_Russell_Darl.jpg"
+    Image.new("L", (8, 8)).save(file, format="JPEG")
+    stored = ObituaryRecord(
+        image_path="old_name.jpg",
+        text_content="Stored OCR text",
+        content_hash=file_content_hash(file),
+    )
+    with (
+        patch("src.transcriber.transcribe_image") as mock_transcribe,
+        patch("src.transcriber.ObituaryDatabase") as mock_database,
+    ):
+        mock_database.return_value.get_records_by_image_path.return_value = {
+            "old_name.jpg": stored
+        }
+
+        records = transcribe_images(tmp_path, workers=1)
+
+    # The stored text is reused, but a row is stored under the new name
+    mock_transcribe.assert_not_called()
+    mock_database.return_value.add_records.assert_called_once_with(records)
+    [record] = records
+    assert record.image_path == "19910110_Alt_Russell_Darl.jpg"
+    assert record.text_content == "Stored OCR text"
+    assert record.content_hash == stored.content_hash
+    assert record.obituary_url == (
+        "http://obit.glbthistory.org/olo/display.jsp?name=19910110_Alt_Russell_Darl"
+    )
+    assert record.year == "1991"
+
+
+def test_transcribe_images_transcribes_files_that_fail_to_hash(
     temp_image_directory,
-    mock_preprocess_image,
 ):
+    record = MagicMock()
     with (
-        patch("cv2.imwrite") as mock_cv2_imwrite,
-        patch("PIL.Image.open") as mock_image_open,
+        patch("src.transcriber.file_content_hash", side_effect=PermissionError),
+        patch(
+            "src.transcriber.transcribe_image", return_value=record
+        ) as mock_transcribe,
+        patch("src.transcriber.ObituaryDatabase") as mock_database,
     ):
-        mock_image_open.side_effect = UnidentifiedImageError
+        mock_database.return_value.get_records_by_image_path.return_value = {}
+
+        records = transcribe_images(temp_image_directory, workers=1)
+
+    mock_transcribe.assert_called_once_with(
+        temp_image_directory / "test_image.jpg", spellcheck=False
+    )
+    assert records == [record]
+    assert record.content_hash is None
+
+
+def test_transcribe_images_skips_unreadable_files(
+    tmp_path: Path, mock_pytesseract, mock_clean_text
+):
+    # A directory with an image name can be neither hashed nor read
+    (tmp_path / "19910110_Alt_Russell_Darl.jpg").mkdir()
+    Image.new("L", (8, 8)).save(tmp_path / "19910111_Brown_James_E.jpg", format="JPEG")
 
-        transcribe_images(temp_image_directory, spellcheck=False)
+    records = transcribe_images(
+        tmp_path, db_path=str(tmp_path / "obituaries.db"), workers=1
+    )
 
-        mock_preprocess_image.assert_called_once()
-        mock_cv2_imwrite.assert_called_once()
+    assert [record.image_path for record in records] == ["19910111_Brown_James_E.jpg"]